@@ -0,0 +1,47 @@
+"""add display_name to leaderboard_entry
+
+Revision ID: 808c7a430798
+Revises: 7c818e95cae5
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '808c7a430798'
+down_revision = '7c818e95cae5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add as nullable, backfill from player, then enforce NOT NULL
+    op.add_column(
+        'leaderboard_entry',
+        sa.Column('display_name', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE leaderboard_entry
+        SET display_name = player.display_name
+        FROM player
+        WHERE leaderboard_entry.player_id = player.id
+        """
+    )
+    op.alter_column('leaderboard_entry', 'display_name', nullable=False)
+
+    # Covering index for leaderboard reads (ordered by solve time per puzzle)
+    op.create_index(
+        'ix_leaderboard_entry_puzzle_id_solve_time_ms',
+        'leaderboard_entry',
+        ['puzzle_id', 'solve_time_ms'],
+        postgresql_include=['player_id', 'display_name'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_entry_puzzle_id_solve_time_ms', table_name='leaderboard_entry')
+    op.drop_column('leaderboard_entry', 'display_name')
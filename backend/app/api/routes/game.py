@@ -4,7 +4,7 @@ import uuid
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlmodel import select
 
 from app.api.deps import SessionDep
@@ -35,6 +35,8 @@ SOLVE_THRESHOLD = 100  # Points needed to "solve" the puzzle
 class TileSchema(BaseModel):
     """A single tile in the puzzle grid."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     letters: str
 
@@ -42,6 +44,8 @@ class TileSchema(BaseModel):
 class PreviousResultSchema(BaseModel):
     """Result from a previous game session."""
 
+    model_config = ConfigDict(frozen=True)
+
     final_score: int
     solve_time_ms: int | None = None
     words_found: list[str]
@@ -58,6 +62,8 @@ class GameStartRequest(BaseModel):
 class GameStartResponse(BaseModel):
     """Response when starting a new game."""
 
+    model_config = ConfigDict(frozen=True)
+
     session_id: str  # UUID as string
     player_id: str  # UUID as string (stable identifier)
     display_name: str  # AdjectiveNoun format for display
@@ -76,6 +82,8 @@ class WordValidationRequest(BaseModel):
 class WordValidationResponse(BaseModel):
     """Response after validating a word."""
 
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool
     points: int | None = None  # Points earned if valid
     reason: str | None = None  # Error reason if invalid
@@ -87,6 +95,8 @@ class WordValidationResponse(BaseModel):
 class GameSubmitResponse(BaseModel):
     """Response after submitting/finalizing a game."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     final_score: int  # Server-calculated
     solve_time_ms: int | None = None  # Server-calculated, None if not solved
@@ -97,6 +107,8 @@ class GameSubmitResponse(BaseModel):
 class HintResponse(BaseModel):
     """Response after requesting a hint."""
 
+    model_config = ConfigDict(frozen=True)
+
     hint_number: int  # Which hint this is (1-5)
     definition: str | None = None  # WordNet definition of unfound quartile
     time_penalty_ms: int  # Penalty added to solve time
@@ -182,7 +194,8 @@ def _parse_tiles_json(tiles_json: str) -> list[TileSchema]:
     import json
 
     tiles_data = json.loads(tiles_json)
-    return [TileSchema(id=t["id"], letters=t["letters"]) for t in tiles_data]
+    # Stored tiles were validated at generation time, skip re-validation
+    return [TileSchema.model_construct(id=t["id"], letters=t["letters"]) for t in tiles_data]
 
 
 def _parse_words_json(words_json: str) -> list[str]:
@@ -495,6 +508,7 @@ async def submit_game(
         entry = LeaderboardEntry(
             puzzle_id=session.puzzle_id,
             player_id=session.player_id,
+            display_name=session.player.display_name,
             solve_time_ms=total_time_ms,
         )
         db.add(entry)
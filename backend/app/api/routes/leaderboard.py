@@ -3,11 +3,11 @@
 from datetime import date
 
 from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlmodel import select
 
 from app.api.deps import SessionDep
-from app.models import LeaderboardEntry, Player, Puzzle
+from app.models import LeaderboardEntry, Puzzle
 
 router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
 
@@ -18,6 +18,8 @@ router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
 class LeaderboardEntrySchema(BaseModel):
     """A single leaderboard entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     rank: int
     player_id: str  # UUID as string
     display_name: str  # AdjectiveNoun format
@@ -27,6 +29,8 @@ class LeaderboardEntrySchema(BaseModel):
 class LeaderboardResponse(BaseModel):
     """Leaderboard data for a puzzle."""
 
+    model_config = ConfigDict(frozen=True)
+
     puzzle_id: str
     puzzle_date: date
     entries: list[LeaderboardEntrySchema]
@@ -105,15 +109,13 @@ async def get_todays_leaderboard(
         .limit(limit)
     ).all()
 
-    # Get player info for each entry
     entry_schemas = []
     for i, entry in enumerate(entries):
-        player = db.get(Player, entry.player_id)
         entry_schemas.append(
-            LeaderboardEntrySchema(
+            LeaderboardEntrySchema.model_construct(
                 rank=i + 1,
                 player_id=str(entry.player_id),
-                display_name=player.display_name if player else "Unknown",
+                display_name=entry.display_name,
                 solve_time_ms=entry.solve_time_ms,
             )
         )
@@ -183,12 +185,11 @@ async def get_leaderboard_by_date(
 
     entry_schemas = []
     for i, entry in enumerate(entries):
-        player = db.get(Player, entry.player_id)
         entry_schemas.append(
-            LeaderboardEntrySchema(
+            LeaderboardEntrySchema.model_construct(
                 rank=i + 1,
                 player_id=str(entry.player_id),
-                display_name=player.display_name if player else "Unknown",
+                display_name=entry.display_name,
                 solve_time_ms=entry.solve_time_ms,
             )
         )
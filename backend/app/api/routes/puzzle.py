@@ -3,7 +3,7 @@
 from datetime import date
 
 from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlmodel import select
 
 from app.api.deps import SessionDep
@@ -19,6 +19,8 @@ router = APIRouter(prefix="/puzzle", tags=["puzzle"])
 class TileSchema(BaseModel):
     """A single tile in the puzzle grid."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     letters: str
 
@@ -26,6 +28,8 @@ class TileSchema(BaseModel):
 class PuzzleResponse(BaseModel):
     """Puzzle data returned to client."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str  # UUID as string
     date: date
     tiles: list[TileSchema]
@@ -48,7 +52,8 @@ def _parse_tiles_json(tiles_json: str) -> list[TileSchema]:
     import json
 
     tiles_data = json.loads(tiles_json)
-    return [TileSchema(id=t["id"], letters=t["letters"]) for t in tiles_data]
+    # Stored tiles were validated at generation time, skip re-validation
+    return [TileSchema.model_construct(id=t["id"], letters=t["letters"]) for t in tiles_data]
 
 
 def _puzzle_to_response(puzzle: Puzzle) -> PuzzleResponse:
@@ -6,7 +6,11 @@ It has NO dependencies on FastAPI, SQLModel, or Pydantic.
 
 from __future__ import annotations
 
+import mmap
 import pickle  # noqa: S403 - trusted data only
+import struct
+import sys
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -17,6 +21,24 @@ if TYPE_CHECKING:
 # Default dictionary location (relative to this file)
 DEFAULT_DICTIONARY_PATH = Path(__file__).parent.parent.parent / "data" / "dictionary.bin"
 
+# Flat trie layout: one fixed 26-slot row per node, indexed by ord(letter) - ord("A")
+ALPHABET_SIZE = 26
+NO_CHILD = -1
+_EMPTY_ROW = array("i", [NO_CHILD] * ALPHABET_SIZE)
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Binary file layout (little-endian):
+#   header:          magic, format version, node_count, word_count, children_offset, pool_offset
+#   children:        node_count * 26 int32 child ids
+#   child_masks:     node_count uint32 bitmasks
+#   definition_ids:  node_count int32 indexes into the definition pool
+#   is_word:         node_count uint8 flags
+#   pool:            uint32 entry count, (count + 1) uint32 offsets, then the UTF-8 text
+_MAGIC = b"DICT"
+_FORMAT_VERSION = 3
+_HEADER = struct.Struct("<4sIIIII")
+NO_DEFINITION = 0  # Pool index 0 is reserved for "no definition"
+
 
 @dataclass
 class TrieNode:
@@ -27,6 +49,325 @@ class TrieNode:
     definition: str | None = None
 
 
+class FlatTrie:
+    """Prefix tree stored as parallel arrays instead of linked node objects.
+
+    Node ``n`` owns the slots ``children[n * 26 : n * 26 + 26]``, one per
+    letter A-Z, each holding the child's node id or ``NO_CHILD``. Node 0 is
+    the root. ``child_masks[n]`` has bit ``i`` set when letter ``i`` has a
+    child, so enumerating a node's children skips the empty slots.
+    Definitions are interned: each distinct string is stored once in
+    ``definition_pool`` and nodes refer to it by index. This keeps a large
+    dictionary in a handful of contiguous buffers that can be written to disk
+    as-is and memory-mapped back without allocating an object per node.
+    """
+
+    def __init__(
+        self,
+        children: array[int] | memoryview | None = None,
+        child_masks: array[int] | memoryview | None = None,
+        is_word: bytearray | memoryview | None = None,
+        definition_ids: array[int] | memoryview | None = None,
+        definition_pool: list[str] | _StringTable | None = None,
+        word_count: int | None = None,
+    ) -> None:
+        """Initialize from existing arrays, or as an empty trie with just a root.
+
+        Args:
+            children: Flat child table of ``node_count * 26`` node ids.
+            child_masks: One bitmask of present children per node.
+            is_word: One byte per node, non-zero if the node ends a word.
+            definition_ids: One ``definition_pool`` index per node.
+            definition_pool: Distinct definitions; entry 0 means none.
+            word_count: Number of words stored. Required once nodes are
+                shared between paths; otherwise it is counted from ``is_word``.
+        """
+        self.children = children if children is not None else array("i", _EMPTY_ROW)
+        self.child_masks = child_masks if child_masks is not None else array("I", [0])
+        self.is_word = is_word if is_word is not None else bytearray(1)
+        self.definition_ids = definition_ids if definition_ids is not None else array("i", [NO_DEFINITION])
+        self.definition_pool = definition_pool if definition_pool is not None else [""]
+        self.word_count = word_count if word_count is not None else bytes(self.is_word).count(1)
+        self._pool_index: dict[str, int] = {}  # Interning map used by add_word
+        self._last_word = ""
+        self._last_path = [0]
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the trie, including the root."""
+        return len(self.is_word)
+
+    def _new_node(self) -> int:
+        """Append an empty node.
+
+        Returns:
+            The new node's id.
+        """
+        self.children.extend(_EMPTY_ROW)
+        self.child_masks.append(0)
+        self.is_word.append(0)
+        self.definition_ids.append(NO_DEFINITION)
+        return len(self.is_word) - 1
+
+    def definition(self, node: int) -> str | None:
+        """Return the definition stored on a node, or None."""
+        definition_id = self.definition_ids[node]
+        if definition_id == NO_DEFINITION:
+            return None
+        return self.definition_pool[definition_id]
+
+    def _intern(self, definition: str | None) -> int:
+        """Return the pool index for a definition, adding it if new."""
+        if not definition:
+            return NO_DEFINITION
+        definition_id = self._pool_index.get(definition)
+        if definition_id is None:
+            definition_id = len(self.definition_pool)
+            self.definition_pool.append(definition)
+            self._pool_index[definition] = definition_id
+        return definition_id
+
+    def add_word(self, word: str, definition: str | None = None) -> None:
+        """Insert a word, creating any missing nodes along its path.
+
+        The path of the previously added word is kept, and insertion resumes
+        from the longest prefix the two words share. Adding words in sorted
+        order therefore only walks the characters that differ.
+
+        Args:
+            word: The word to add (case-insensitive, letters A-Z only).
+            definition: Optional definition stored on the word's final node.
+
+        Raises:
+            ValueError: If the word contains characters outside A-Z.
+        """
+        word = word.upper()
+        if word and not (word.isascii() and word.isalpha()):
+            message = f"Cannot add {word!r}: only letters A-Z are supported"
+            raise ValueError(message)
+
+        previous = self._last_word
+        shared = 0
+        limit = min(len(previous), len(word))
+        while shared < limit and previous[shared] == word[shared]:
+            shared += 1
+
+        # path[i] is the node for word[:i]
+        path = self._last_path
+        del path[shared + 1 :]
+        children = self.children
+        node = path[-1]
+        for char in word[shared:]:
+            index = ord(char) - 65
+            slot = node * ALPHABET_SIZE + index
+            child = children[slot]
+            if child == NO_CHILD:
+                child = self._new_node()
+                children[slot] = child
+                self.child_masks[node] |= 1 << index
+            node = child
+            path.append(node)
+        self._last_word = word
+        if not self.is_word[node]:
+            self.word_count += 1
+        self.is_word[node] = 1
+        self.definition_ids[node] = self._intern(definition)
+
+    def find(self, text: str) -> int:
+        """Return the node id reached by following ``text`` from the root.
+
+        Args:
+            text: The path to follow (will be uppercased).
+
+        Returns:
+            The node id, or ``NO_CHILD`` if the path doesn't exist.
+        """
+        children = self.children
+        node = 0
+        for char in text.upper():
+            index = ord(char) - 65
+            if not 0 <= index < ALPHABET_SIZE:
+                return NO_CHILD
+            node = children[node * ALPHABET_SIZE + index]
+            if node == NO_CHILD:
+                return NO_CHILD
+        return node
+
+    def minimized(self) -> FlatTrie:
+        """Return an equivalent trie with identical subtrees merged.
+
+        Nodes whose word flag, definition, and children all match are the
+        same state, so shared suffixes such as "-ING" or "-NESS" collapse
+        into one copy and the trie becomes a DAWG. Definitions are part of
+        the match, which keeps every word's definition intact. The result
+        shares nodes between paths, so it is meant for lookups and writing
+        only; don't add words to it.
+
+        Returns:
+            A new, compacted FlatTrie.
+        """
+        children = self.children
+        child_masks = self.child_masks
+        is_word = self.is_word
+        definition_ids = self.definition_ids
+        node_count = self.node_count
+
+        # Children always have higher ids than their parent, so a descending
+        # scan visits every subtree before the node that points at it.
+        canonical = array("i", [0]) * node_count
+        registry: dict[tuple[int, ...], int] = {}
+        for node in range(node_count - 1, -1, -1):
+            base = node * ALPHABET_SIZE
+            mask = child_masks[node]
+            signature = [is_word[node], definition_ids[node], mask]
+            while mask:
+                index = mask.bit_length() - 1
+                mask ^= 1 << index
+                signature.append(canonical[children[base + index]])
+            canonical[node] = registry.setdefault(tuple(signature), node)
+
+        kept = sorted(registry.values())
+        new_id = dict(zip(kept, range(len(kept)), strict=True))
+        trie = FlatTrie(
+            children=array("i", _EMPTY_ROW) * len(kept),
+            child_masks=array("I", (child_masks[node] for node in kept)),
+            is_word=bytearray(is_word[node] for node in kept),
+            definition_ids=array("i", (definition_ids[node] for node in kept)),
+            definition_pool=list(self.definition_pool),
+            word_count=self.word_count,
+        )
+        for node in kept:
+            base = node * ALPHABET_SIZE
+            new_base = new_id[node] * ALPHABET_SIZE
+            mask = child_masks[node]
+            while mask:
+                index = mask.bit_length() - 1
+                mask ^= 1 << index
+                trie.children[new_base + index] = new_id[canonical[children[base + index]]]
+        return trie
+
+    def write(self, path: Path) -> None:
+        """Write the trie to a binary file that ``FlatTrie.open`` can map.
+
+        Args:
+            path: Destination file path.
+        """
+        node_count = self.node_count
+        children = array("i", self.children)
+        child_masks = array("I", self.child_masks)
+        definition_ids = array("i", self.definition_ids)
+
+        encoded = [text.encode() for text in self.definition_pool]
+        offsets = array("I", [len(encoded), 0])
+        for text in encoded:
+            offsets.append(offsets[-1] + len(text))
+
+        if sys.byteorder == "big":
+            for values in (children, child_masks, definition_ids, offsets):
+                values.byteswap()
+
+        children_offset = _HEADER.size
+        pool_offset = children_offset + (node_count * ALPHABET_SIZE + 2 * node_count) * 4 + node_count
+        padding = -pool_offset % 4
+        pool_offset += padding
+
+        with Path(path).open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, node_count, self.word_count, children_offset, pool_offset))
+            f.write(children.tobytes())
+            f.write(child_masks.tobytes())
+            f.write(definition_ids.tobytes())
+            f.write(bytes(self.is_word))
+            f.write(bytes(padding))
+            f.write(offsets.tobytes())
+            f.writelines(encoded)
+
+    @classmethod
+    def open(cls, path: Path) -> FlatTrie:
+        """Memory-map a trie written by ``FlatTrie.write``.
+
+        Lookups index straight into the mapped file, so opening costs one
+        mmap call regardless of dictionary size. The returned trie is
+        read-only.
+
+        Args:
+            path: Path to the binary trie file.
+
+        Returns:
+            A read-only FlatTrie over the mapped file.
+
+        Raises:
+            ValueError: If the file is not a binary trie of the current format.
+        """
+        with Path(path).open("rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, node_count, word_count, children_offset, pool_offset = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            message = f"{path} is not a binary dictionary trie"
+            raise ValueError(message)
+        if version != _FORMAT_VERSION:
+            message = f"{path} uses trie format {version}, expected {_FORMAT_VERSION}. Rebuild the dictionary."
+            raise ValueError(message)
+
+        view = memoryview(buffer)
+        masks_offset = children_offset + node_count * ALPHABET_SIZE * 4
+        definition_ids_offset = masks_offset + node_count * 4
+        is_word_offset = definition_ids_offset + node_count * 4
+        return cls(
+            children=_int_view(view[children_offset:masks_offset], "i"),
+            child_masks=_int_view(view[masks_offset:definition_ids_offset], "I"),
+            is_word=view[is_word_offset : is_word_offset + node_count],
+            definition_ids=_int_view(view[definition_ids_offset:is_word_offset], "i"),
+            definition_pool=_StringTable(view[pool_offset:]),
+            word_count=word_count,
+        )
+
+
+def _int_view(buffer: memoryview, typecode: str) -> array[int] | memoryview:
+    """View little-endian 32-bit integers in ``buffer`` without copying.
+
+    Big-endian hosts get a byte-swapped copy instead.
+
+    Args:
+        buffer: A section of the mapped file holding packed integers.
+        typecode: ``"i"`` for signed or ``"I"`` for unsigned values.
+
+    Returns:
+        The integers as a memoryview cast, or as an array on big-endian hosts.
+    """
+    if sys.byteorder == "little":
+        return buffer.cast(typecode)
+    values = array(typecode, buffer.tobytes())
+    values.byteswap()
+    return values
+
+
+class _StringTable:
+    """Lazily decoded string pool from a mapped dictionary file."""
+
+    def __init__(self, buffer: memoryview) -> None:
+        """Split the pool section into its offset index and text.
+
+        Args:
+            buffer: The pool section of the mapped file.
+        """
+        (count,) = struct.unpack_from("<I", buffer)
+        index_end = (count + 2) * 4
+        self._offsets = _int_view(buffer[4:index_end], "I")
+        self._text = buffer[index_end:]
+
+    def __getitem__(self, index: int) -> str:
+        """Decode one pool entry.
+
+        Args:
+            index: Position of the entry in the pool.
+
+        Returns:
+            The entry's text.
+        """
+        return str(self._text[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+
 class Dictionary:
     """Trie-backed dictionary for efficient word validation.
 
@@ -68,8 +409,14 @@ class Dictionary:
             raise FileNotFoundError(message)
 
         with Path(path).open("rb") as f:
-            root = pickle.load(f)  # noqa: S301 - trusted data
-
+            is_flat = f.read(len(_MAGIC)) == _MAGIC
+            if not is_flat:
+                # Older builds pickled the TrieNode graph
+                f.seek(0)
+                root = pickle.load(f)  # noqa: S301 - trusted data
+
+        if is_flat:
+            return FlatDictionary(FlatTrie.open(path))
         return cls(root)
 
     def _traverse(self, text: str) -> TrieNode | None:
@@ -151,6 +498,30 @@ class Dictionary:
 
         yield from _collect(node, prefix_upper)
 
+    def entries(self, min_length: int = 1, max_length: int | None = None) -> Iterator[tuple[str, str | None]]:
+        """Yield every word with its definition, within a length range.
+
+        Definitions are read during the walk, so callers don't need a
+        get_definition lookup per word, and branches longer than max_length
+        are never entered.
+
+        Args:
+            min_length: Shortest word length to yield.
+            max_length: Longest word length to yield, or None for no limit.
+
+        Yields:
+            (word, definition) pairs; definition is None when the word has none.
+        """
+
+        def _collect(node: TrieNode, text: str) -> Iterator[tuple[str, str | None]]:
+            if node.is_word and len(text) >= min_length:
+                yield text, node.definition
+            if max_length is None or len(text) < max_length:
+                for char, child in node.children.items():
+                    yield from _collect(child, text + char)
+
+        yield from _collect(self._root, "")
+
     def __len__(self) -> int:
         """Return the total number of words in the dictionary."""
         count = 0
@@ -167,6 +538,121 @@ class Dictionary:
         return count
 
 
+class FlatDictionary(Dictionary):
+    """Dictionary backed by a FlatTrie.
+
+    Same interface as Dictionary, but lookups index into the flat child
+    table instead of following per-node dicts.
+    """
+
+    def __init__(self, trie: FlatTrie) -> None:
+        """Initialize with a flat trie.
+
+        Args:
+            trie: The FlatTrie holding the dictionary words.
+        """
+        self._trie = trie
+
+    def contains(self, word: str) -> bool:
+        """Check if word exists in dictionary.
+
+        Args:
+            word: The word to check (case-insensitive).
+
+        Returns:
+            True if word is a valid dictionary word.
+        """
+        node = self._trie.find(word)
+        return node != NO_CHILD and bool(self._trie.is_word[node])
+
+    def contains_prefix(self, prefix: str) -> bool:
+        """Check if any words start with the given prefix.
+
+        Args:
+            prefix: The prefix to check (case-insensitive).
+
+        Returns:
+            True if at least one word starts with this prefix.
+        """
+        return self._trie.find(prefix) != NO_CHILD
+
+    def get_definition(self, word: str) -> str | None:
+        """Get the WordNet definition for a word.
+
+        Args:
+            word: The word to look up (case-insensitive).
+
+        Returns:
+            The definition string, or None if word not found or has no definition.
+        """
+        node = self._trie.find(word)
+        if node != NO_CHILD and self._trie.is_word[node]:
+            return self._trie.definition(node)
+        return None
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield all words starting with the given prefix, in alphabetical order.
+
+        Args:
+            prefix: The prefix to match (case-insensitive).
+
+        Yields:
+            Words that start with the prefix.
+        """
+        node = self._trie.find(prefix)
+        if node == NO_CHILD:
+            return
+
+        children = self._trie.children
+        child_masks = self._trie.child_masks
+        is_word = self._trie.is_word
+        stack = [(node, prefix.upper())]
+        while stack:
+            current, text = stack.pop()
+            if is_word[current]:
+                yield text
+            base = current * ALPHABET_SIZE
+            mask = child_masks[current]
+            # Push highest letter first so children pop in alphabetical order
+            while mask:
+                index = mask.bit_length() - 1
+                mask ^= 1 << index
+                stack.append((children[base + index], text + _LETTERS[index]))
+
+    def entries(self, min_length: int = 1, max_length: int | None = None) -> Iterator[tuple[str, str | None]]:
+        """Yield every word with its definition, in alphabetical order.
+
+        Args:
+            min_length: Shortest word length to yield.
+            max_length: Longest word length to yield, or None for no limit.
+
+        Yields:
+            (word, definition) pairs; definition is None when the word has none.
+        """
+        trie = self._trie
+        children = trie.children
+        child_masks = trie.child_masks
+        is_word = trie.is_word
+        stack = [(0, "")]
+        while stack:
+            current, text = stack.pop()
+            if is_word[current] and len(text) >= min_length:
+                yield text, trie.definition(current)
+            if max_length is not None and len(text) >= max_length:
+                continue
+            base = current * ALPHABET_SIZE
+            mask = child_masks[current]
+            # Push highest letter first so children pop in alphabetical order
+            while mask:
+                index = mask.bit_length() - 1
+                mask ^= 1 << index
+                stack.append((children[base + index], text + _LETTERS[index]))
+
+    def __len__(self) -> int:
+        """Return the total number of words in the dictionary."""
+        return self._trie.word_count
+
+
 # Global dictionary instance for easy access
 _global_dictionary: Dictionary | None = None
 
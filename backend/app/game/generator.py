@@ -11,6 +11,7 @@ Algorithm (Generate-First with CSP):
 from __future__ import annotations
 
 import random
+from itertools import chain
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,9 +21,8 @@ if TYPE_CHECKING:
     from .types import Puzzle, Tile
 
 from .solver import (
-    calculate_total_points,
-    find_all_valid_words,
-    is_quartile_word,
+    find_word_tile_counts,
+    score_word,
 )
 
 MAX_ATTEMPTS = 1000
@@ -59,16 +59,17 @@ def generate_puzzle(
         if tiles is None:
             continue  # Couldn't find valid decomposition
 
-        # Step 3: Find all valid words
-        valid_words = find_all_valid_words(tuple(tiles), dictionary)
+        # Step 3: Find all valid words (with tile counts for scoring)
+        word_tile_counts = find_word_tile_counts(tuple(tiles), dictionary)
+        valid_words = set(word_tile_counts)
 
         # Step 4: Verify our quartiles are found
-        found_quartiles = {w for w in valid_words if is_quartile_word(w, tuple(tiles))}
+        found_quartiles = {w for w, count in word_tile_counts.items() if count == 4}
         if found_quartiles != set(selected_words):
             continue
 
         # Step 5: Check minimum points
-        total_points = calculate_total_points(valid_words, tuple(tiles))
+        total_points = sum(score_word(count) for count in word_tile_counts.values())
         if total_points < MIN_TOTAL_POINTS:
             continue
 
@@ -93,20 +94,7 @@ def _get_quartile_words(dictionary: Dictionary) -> list[str]:
     Returns:
         List of words that meet quartile criteria.
     """
-    # We need to iterate through the dictionary to find suitable words
-    # Since we don't have a direct iteration method, we use words_with_prefix
-    # with single letter prefixes to traverse the dictionary
-    words: list[str] = []
-
-    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-        matching = [
-            word
-            for word in dictionary.words_with_prefix(letter)
-            if MIN_QUARTILE_LENGTH <= len(word) <= MAX_QUARTILE_LENGTH and dictionary.get_definition(word) is not None
-        ]
-        words.extend(matching)
-
-    return words
+    return list(iterate_quartile_candidates(dictionary))
 
 
 def _decompose_words_to_tiles(words: list[str]) -> list[Tile] | None:
@@ -115,25 +103,45 @@ def _decompose_words_to_tiles(words: list[str]) -> list[Tile] | None:
     Each word must split into exactly 4 tiles of 2-4 letters.
     No duplicate tiles across words.
 
+    Words are assigned most-constrained first (fewest possible splits). After
+    each assignment, every unassigned word must still have a split that
+    avoids the tiles used so far; otherwise the search backtracks at once
+    instead of failing on a later word.
+
     Args:
         words: List of 5 words to decompose.
 
     Returns:
         List of 20 Tile objects, or None if decomposition fails.
     """
-    all_tiles: list[Tile] = []
+    from .types import Tile
+
+    splits = [list(_iter_splits(word.upper())) for word in words]
+    order = sorted(range(len(words)), key=lambda index: len(splits[index]))
+    chosen: list[tuple[str, ...]] = [()] * len(words)
     used_tile_letters: set[str] = set()
-    tile_id = 0
 
-    for word in words:
-        tiles = _decompose_single_word(word, used_tile_letters, tile_id)
-        if tiles is None:
-            return None
-        all_tiles.extend(tiles)
-        for tile in tiles:
-            used_tile_letters.add(tile.letters)
-        tile_id += len(tiles)
+    def assign(position: int) -> bool:
+        if position == len(order):
+            return True
+        index = order[position]
+        for split in splits[index]:
+            if not used_tile_letters.isdisjoint(split):
+                continue
+            used_tile_letters.update(split)
+            # Forward check: every later word keeps at least one usable split
+            if all(
+                any(used_tile_letters.isdisjoint(other) for other in splits[later]) for later in order[position + 1 :]
+            ) and assign(position + 1):
+                chosen[index] = split
+                return True
+            used_tile_letters.difference_update(split)
+        return False
+
+    if not assign(0):
+        return None
 
+    all_tiles = [Tile(id=tile_id, letters=letters) for tile_id, letters in enumerate(chain.from_iterable(chosen))]
     if len(all_tiles) != 20:
         return None
 
@@ -157,39 +165,37 @@ def _decompose_single_word(
     """
     from .types import Tile
 
-    word_upper = word.upper()
+    result = next((split for split in _iter_splits(word.upper()) if forbidden_tiles.isdisjoint(split)), None)
+    if result is None:
+        return None
 
-    def backtrack(remaining: str, tiles: list[str]) -> list[str] | None:
-        if not remaining:
-            return tiles if len(tiles) == 4 else None
-        if len(tiles) >= 4:
-            return None
+    return [Tile(id=start_id + i, letters=letters) for i, letters in enumerate(result)]
 
-        # Try tile sizes 2, 3, 4
-        for size in (2, 3, 4):
-            if size > len(remaining):
-                continue
-            tile_letters = remaining[:size]
-            if tile_letters in forbidden_tiles:
-                continue
 
-            # Check remaining can still form valid tiles
-            remaining_after = remaining[size:]
-            remaining_tiles = 4 - len(tiles) - 1
-            if remaining_after and not (2 * remaining_tiles <= len(remaining_after) <= 4 * remaining_tiles):
-                continue
+def _iter_splits(word: str, parts: int = 4) -> Iterator[tuple[str, ...]]:
+    """Yield every split of word into tiles of 2-4 letters.
 
-            result = backtrack(remaining_after, [*tiles, tile_letters])
-            if result is not None:
-                return result
+    Splits are yielded depth-first, trying tile sizes 2, 3, 4 at each
+    position, and branches that leave too few or too many letters for the
+    remaining tiles are pruned.
 
-        return None
+    Args:
+        word: The uppercase word to split.
+        parts: Number of tiles to split the word into.
 
-    result = backtrack(word_upper, [])
-    if result is None:
-        return None
+    Yields:
+        Tuples of tile letters that concatenate to word.
+    """
+    if parts == 1:
+        if 2 <= len(word) <= 4:
+            yield (word,)
+        return
 
-    return [Tile(id=start_id + i, letters=letters) for i, letters in enumerate(result)]
+    for size in (2, 3, 4):
+        remaining = word[size:]
+        if 2 * (parts - 1) <= len(remaining) <= 4 * (parts - 1):
+            for rest in _iter_splits(remaining, parts - 1):
+                yield (word[:size], *rest)
 
 
 def iterate_quartile_candidates(
@@ -207,7 +213,6 @@ def iterate_quartile_candidates(
     Yields:
         Words that have definitions and are within the length range.
     """
-    for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-        for word in dictionary.words_with_prefix(letter):
-            if min_length <= len(word) <= max_length and dictionary.get_definition(word) is not None:
-                yield word
+    for word, definition in dictionary.entries(min_length, max_length):
+        if definition is not None:
+            yield word
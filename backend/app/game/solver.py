@@ -37,20 +37,45 @@ def find_all_valid_words(tiles: Sequence[Tile], dictionary: Dictionary) -> set[s
     Returns:
         Set of all valid words that can be formed from the tiles.
     """
-    valid_words: set[str] = set()
+    return set(find_word_tile_counts(tiles, dictionary))
+
+
+def find_word_tile_counts(tiles: Sequence[Tile], dictionary: Dictionary) -> dict[str, int]:
+    """Find all valid words along with the number of tiles that form each one.
+
+    Permutations are explored in order of increasing length, so the recorded
+    count is the minimal tile count - the same value `get_tile_count` would
+    return, without repeating the permutation search per word.
+
+    Args:
+        tiles: Available tiles to form words from.
+        dictionary: Word dictionary for validation.
+
+    Returns:
+        Mapping of each valid word to the number of tiles that form it.
+    """
+    tile_counts: dict[str, int] = {}
+    letters = [tile.letters for tile in tiles]
+    # Tile index permutations whose letters are a dictionary prefix
+    live_prefixes: set[tuple[int, ...]] = {()}
 
     for num_tiles in range(1, 5):
-        for perm in permutations(tiles, num_tiles):
-            word = "".join(tile.letters for tile in perm)
+        extended: set[tuple[int, ...]] = set()
+        for perm in permutations(range(len(letters)), num_tiles):
+            # Early pruning: extensions of a dead prefix are never looked up
+            if perm[:-1] not in live_prefixes:
+                continue
 
-            # Early pruning: check prefix validity
+            word = "".join(letters[index] for index in perm)
             if not dictionary.contains_prefix(word):
                 continue
+            extended.add(perm)
 
             if dictionary.contains(word):
-                valid_words.add(word)
+                tile_counts.setdefault(word, num_tiles)
+        live_prefixes = extended
 
-    return valid_words
+    return tile_counts
 
 
 def score_word(tile_count: int) -> int:
@@ -68,8 +93,9 @@ def score_word(tile_count: int) -> int:
 def get_tile_count(word: str, tiles: Sequence[Tile]) -> int:
     """Determine how many tiles form this word.
 
-    Finds the minimal number of tiles that can form the given word
-    by searching through tile combinations.
+    Finds the minimal number of tiles that can form the given word by
+    walking its letters and only branching into tiles that match at the
+    current position, instead of enumerating tile permutations.
 
     Args:
         word: The word to analyze.
@@ -81,11 +107,27 @@ def get_tile_count(word: str, tiles: Sequence[Tile]) -> int:
     Raises:
         ValueError: If the word cannot be formed from the tiles.
     """
-    for num_tiles in range(1, 5):
-        for perm in permutations(tiles, num_tiles):
-            formed = "".join(tile.letters for tile in perm)
-            if formed == word:
-                return num_tiles
+    used = [False] * len(tiles)
+
+    def fewest_tiles(position: int, tiles_used: int) -> int | None:
+        if position == len(word):
+            return tiles_used
+        if tiles_used == 4:
+            return None
+        best: int | None = None
+        for index, tile in enumerate(tiles):
+            if used[index] or not word.startswith(tile.letters, position):
+                continue
+            used[index] = True
+            count = fewest_tiles(position + len(tile.letters), tiles_used + 1)
+            used[index] = False
+            if count is not None and (best is None or count < best):
+                best = count
+        return best
+
+    tile_count = fewest_tiles(0, 0) if word else None
+    if tile_count is not None:
+        return tile_count
 
     msg = f"Word '{word}' cannot be formed from the given tiles"
     raise ValueError(msg)
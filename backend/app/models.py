@@ -8,7 +8,7 @@ from datetime import date as date_type
 from typing import Optional
 
 from pydantic import EmailStr
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -221,13 +221,26 @@ class LeaderboardEntry(SQLModel, table=True):
 
     Only players who reach the 100-point solve threshold get leaderboard entries.
     Rank is computed when querying (not stored) for simplicity.
+
+    The player's display_name is copied onto the entry at submit time so
+    leaderboard reads don't need to join the player table.
     """
 
     __tablename__ = "leaderboard_entry"
+    __table_args__ = (
+        # Covering index so leaderboard reads are a single index-only scan
+        Index(
+            "ix_leaderboard_entry_puzzle_id_solve_time_ms",
+            "puzzle_id",
+            "solve_time_ms",
+            postgresql_include=["player_id", "display_name"],
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     puzzle_id: uuid.UUID = Field(foreign_key="puzzle.id", index=True)
     player_id: uuid.UUID = Field(foreign_key="player.id", index=True)
+    display_name: str = Field(max_length=50)  # Snapshot of Player.display_name
     solve_time_ms: int  # Server-calculated, includes hint penalties
     created_at: datetime | None = Field(
         default_factory=get_datetime_utc,
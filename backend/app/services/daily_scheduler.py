@@ -9,21 +9,28 @@ import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from app.services.puzzle_scheduler import generate_upcoming_puzzles
+from app.services.puzzle_scheduler import generate_upcoming_puzzles, upcoming_puzzles_exist
 
 logger = logging.getLogger(__name__)
 
 # Default days ahead to pre-generate puzzles for
 DEFAULT_GENERATION_DAYS_AHEAD = 7
 
+# Seconds a missed midnight run may still fire after (e.g. across a restart)
+MISFIRE_GRACE_SECONDS = 3600
+
 
 def _generate_puzzles_sync() -> None:
     """Synchronous puzzle generation task.
 
     Called by scheduler at midnight UTC to pre-generate puzzles.
+    Skips generation when every upcoming puzzle already exists.
     Logs success/failure for monitoring.
     """
     try:
+        if upcoming_puzzles_exist(days_ahead=DEFAULT_GENERATION_DAYS_AHEAD):
+            logger.info("Upcoming puzzles already exist, skipping scheduled generation")
+            return
         logger.info("Starting scheduled puzzle generation...")
         generate_upcoming_puzzles(days_ahead=DEFAULT_GENERATION_DAYS_AHEAD)
         logger.info("Completed scheduled puzzle generation")
@@ -78,6 +85,9 @@ class DailyPuzzleScheduler:
             minute=0,
             id="daily_puzzle_generation",
             replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=MISFIRE_GRACE_SECONDS,
+            max_instances=1,
         )
 
         # Generate puzzles for today and upcoming days on startup
@@ -3,7 +3,9 @@
 import json
 from datetime import date, timedelta
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, func, select
 
 from app.game.dictionary import get_dictionary
 from app.game.generator import generate_puzzle
@@ -28,12 +30,14 @@ def get_cooled_down_quartiles(db: Session) -> set[str]:
     return {c.word for c in cooldowns}
 
 
-def update_quartile_cooldowns(db: Session, quartile_words: list[str]) -> None:
+def update_quartile_cooldowns(db: Session, quartile_words: list[str], *, commit: bool = True) -> None:
     """Update cooldown records for used quartile words.
 
     Args:
         db: Database session
         quartile_words: List of quartile words to update cooldowns for
+        commit: Whether to commit the changes. Pass False when the caller
+            manages the surrounding transaction.
     """
     from datetime import UTC, datetime
 
@@ -46,10 +50,11 @@ def update_quartile_cooldowns(db: Session, quartile_words: list[str]) -> None:
         else:
             cooldown = QuartileCooldown(word=word, last_used_date=today)
             db.add(cooldown)
-    db.commit()
+    if commit:
+        db.commit()
 
 
-def ensure_puzzle_exists_for_date(target_date: date, db: Session) -> Puzzle:
+def ensure_puzzle_exists_for_date(target_date: date, db: Session, *, own_transaction: bool = True) -> Puzzle:
     """Get or create puzzle for given date.
 
     Uses lazy generation - creates puzzle on first request if not exists.
@@ -57,6 +62,9 @@ def ensure_puzzle_exists_for_date(target_date: date, db: Session) -> Puzzle:
     Args:
         target_date: The date to get/create puzzle for
         db: Database session
+        own_transaction: Whether to commit the new puzzle. When False, the
+            puzzle and its cooldowns are written inside a savepoint and the
+            caller is responsible for committing the outer transaction.
 
     Returns:
         The puzzle for the given date
@@ -90,20 +98,75 @@ def ensure_puzzle_exists_for_date(target_date: date, db: Session) -> Puzzle:
         valid_words_json=valid_words_json,
         total_available_points=game_puzzle.total_points,
     )
-    db.add(puzzle)
+    quartile_words = list(game_puzzle.quartile_words)
+
+    if not own_transaction:
+        # Savepoint so a failure only discards this date's writes
+        with db.begin_nested():
+            return _insert_puzzle(db, puzzle, quartile_words)
+
+    stored = _insert_puzzle(db, puzzle, quartile_words)
     db.commit()
-    db.refresh(puzzle)
+    return stored
+
+
+def _insert_puzzle(db: Session, puzzle: Puzzle, quartile_words: list[str]) -> Puzzle:
+    """Insert a puzzle, returning whichever row owns its date.
+
+    Uses INSERT ... ON CONFLICT (date) DO UPDATE ... RETURNING so a puzzle
+    created concurrently by another worker is returned instead of raising,
+    without a separate SELECT round-trip.
+
+    Args:
+        db: Database session
+        puzzle: Newly generated puzzle to insert
+        quartile_words: Quartile words of the new puzzle
+
+    Returns:
+        The stored puzzle for the date
+    """
+    stmt = pg_insert(Puzzle).values(**puzzle.model_dump())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Puzzle.date],
+        set_={"date": stmt.excluded.date},
+    ).returning(Puzzle)
+    stored = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+    # Only the worker whose row won should record the cooldowns
+    if stored.id == puzzle.id:
+        update_quartile_cooldowns(db, quartile_words, commit=False)
 
-    # Update cooldowns for used quartile words
-    update_quartile_cooldowns(db, list(game_puzzle.quartile_words))
+    return stored
 
-    return puzzle
+
+def upcoming_puzzles_exist(days_ahead: int = 7) -> bool:
+    """Check whether puzzles already exist for today and the upcoming days.
+
+    Args:
+        days_ahead: Number of days (starting today) to check
+
+    Returns:
+        True if every date in the window already has a puzzle
+    """
+    from datetime import UTC, datetime
+
+    from app.core.db import engine
+
+    today = datetime.now(UTC).date()
+    last_date = today + timedelta(days=days_ahead - 1)
+    with Session(engine) as db:
+        count = db.exec(
+            select(func.count()).select_from(Puzzle).where(Puzzle.date.between(today, last_date))  # type: ignore[attr-defined]
+        ).one()
+    return count >= days_ahead
 
 
 def generate_upcoming_puzzles(days_ahead: int = 7) -> None:
     """Pre-generate puzzles for upcoming days.
 
-    Called by background task/cron job for reliability.
+    Called by background task/cron job for reliability. All dates are
+    generated in a single transaction with one savepoint per date, so the
+    run commits once and a failure only rolls back the affected date.
 
     Args:
         days_ahead: Number of days to generate puzzles for
@@ -112,11 +175,11 @@ def generate_upcoming_puzzles(days_ahead: int = 7) -> None:
 
     from app.core.db import engine
 
-    with Session(engine) as db:
+    with Session(engine) as db, db.begin():
         for offset in range(days_ahead):
             target_date = datetime.now(UTC).date() + timedelta(days=offset)
             try:
-                ensure_puzzle_exists_for_date(target_date, db)
-            except RuntimeError as e:
+                ensure_puzzle_exists_for_date(target_date, db, own_transaction=False)
+            except (RuntimeError, IntegrityError) as e:
                 # Log but continue with other dates
                 print(f"Warning: {e}")
@@ -154,15 +154,33 @@ class TestGeneratePuzzlesTask:
         """Test the generate_puzzles_task function succeeds."""
         from app.services.daily_scheduler import _generate_puzzles_sync
 
-        with patch("app.services.daily_scheduler.generate_upcoming_puzzles") as mock_generate:
+        with (
+            patch("app.services.daily_scheduler.upcoming_puzzles_exist", return_value=False),
+            patch("app.services.daily_scheduler.generate_upcoming_puzzles") as mock_generate,
+        ):
             _generate_puzzles_sync()
 
             mock_generate.assert_called_once_with(days_ahead=7)
 
+    def test_generate_puzzles_task_skips_existing(self) -> None:
+        """Test that generation is skipped when upcoming puzzles already exist."""
+        from app.services.daily_scheduler import _generate_puzzles_sync
+
+        with (
+            patch("app.services.daily_scheduler.upcoming_puzzles_exist", return_value=True),
+            patch("app.services.daily_scheduler.generate_upcoming_puzzles") as mock_generate,
+        ):
+            _generate_puzzles_sync()
+
+            mock_generate.assert_not_called()
+
     def test_generate_puzzles_task_handles_errors(self) -> None:
         """Test that generate_puzzles_task handles errors gracefully."""
         from app.services.daily_scheduler import _generate_puzzles_sync
 
-        with patch("app.services.daily_scheduler.generate_upcoming_puzzles", side_effect=RuntimeError("Test error")):
+        with (
+            patch("app.services.daily_scheduler.upcoming_puzzles_exist", return_value=False),
+            patch("app.services.daily_scheduler.generate_upcoming_puzzles", side_effect=RuntimeError("Test error")),
+        ):
             # Should not raise an exception
             _generate_puzzles_sync()
@@ -2,86 +2,135 @@
 """Build the game dictionary from SCOWL, COCA, and WordNet.
 
 Usage:
-    python backend/scripts/build_dictionary.py
+    python backend/scripts/build_dictionary.py [--force]
 
 Output:
     backend/data/dictionary.bin
 """
 
-import pickle
-import re
+from __future__ import annotations
+
+import csv
+import functools
+import gzip
+import hashlib
+import json
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path to import from app.game
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.game.dictionary import TrieNode
-
-# Ensure WordNet is downloaded
-try:
-    import nltk
-    from nltk.corpus import wordnet as wn
+from app.game import dictionary as dictionary_module
+from app.game.dictionary import ALPHABET_SIZE, NO_CHILD, NO_DEFINITION, FlatTrie
 
-    wn.synsets("test")
-except (ImportError, LookupError):
-    import nltk
-
-    nltk.download("wordnet")
-    nltk.download("omw-1.4")
-    from nltk.corpus import wordnet as wn
+if TYPE_CHECKING:
+    from nltk.corpus.reader.wordnet import WordNetCorpusReader
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 RAW_DIR = DATA_DIR / "raw"
 OUTPUT_PATH = DATA_DIR / "dictionary.bin"
+MANIFEST_PATH = DATA_DIR / "dictionary.bin.manifest"
+WORD_LIST_PATH = RAW_DIR / "english-words.txt.gz"
+PLAIN_WORD_LIST_PATH = RAW_DIR / "english-words.txt"  # Uncompressed manual download
+COCA_PATH = RAW_DIR / "coca-frequencies.csv"
+BLOCKLIST_PATH = RAW_DIR / "blocklist.txt"
 
 # Configuration
 MIN_WORD_LENGTH = 3
 MAX_COCA_RANK = 30_000  # Only include words in top 30K by frequency
+WORDNET_POS_ORDER = ("n", "v", "a", "r")  # Order wn.synsets() lists senses in
+UNRANKED_SENSE = 1_000  # Lemmas that aren't their synset's head word sort last
 
 
 class DictionaryBuilder:
-    """Build a trie-based dictionary from word sources."""
+    """Build a flat array-backed trie from word sources."""
 
     def __init__(self) -> None:
         """Initialize the builder."""
-        self.root = TrieNode()
+        self.trie = FlatTrie()
         self.word_count = 0
+        self.words_with_defs = 0
 
     def add_word(self, word: str, definition: str | None = None) -> None:
         """Add a word to the trie."""
-        node = self.root
-        for char in word.upper():
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_word = True
-        node.definition = definition
+        self.trie.add_word(word, definition)
         self.word_count += 1
+        if definition:
+            self.words_with_defs += 1
+
+    @classmethod
+    def merge(cls, builders: list[DictionaryBuilder]) -> DictionaryBuilder:
+        """Combine builders whose words start with different letters.
+
+        Each builder's root children are re-attached to a shared root, and
+        its remaining nodes are appended with their ids shifted past the
+        nodes already merged. Definitions are re-interned into one pool.
+
+        Args:
+            builders: Builders with pairwise disjoint first letters.
+
+        Returns:
+            A builder holding the union of all words.
+        """
+        merged = cls()
+        trie = merged.trie
+        empty_row = array("i", [NO_CHILD]) * ALPHABET_SIZE
+        pool_index = {"": NO_DEFINITION}
+        for builder in builders:
+            part = builder.trie
+            # Node k >= 1 of part becomes node k + offset; its root is dropped
+            offset = trie.node_count - 1
+            definition_map = [pool_index.setdefault(text, len(pool_index)) for text in part.definition_pool]
+
+            for node in range(part.node_count):
+                mask = part.child_masks[node]
+                base = node * ALPHABET_SIZE
+                if node == 0:
+                    trie.child_masks[0] |= mask
+                    target_base = 0
+                else:
+                    trie.children.extend(empty_row)
+                    trie.child_masks.append(mask)
+                    trie.is_word.append(part.is_word[node])
+                    trie.definition_ids.append(definition_map[part.definition_ids[node]])
+                    target_base = (node + offset) * ALPHABET_SIZE
+                while mask:
+                    index = mask.bit_length() - 1
+                    mask ^= 1 << index
+                    trie.children[target_base + index] = part.children[base + index] + offset
+
+            trie.word_count += part.word_count
+            merged.word_count += builder.word_count
+            merged.words_with_defs += builder.words_with_defs
+        trie.definition_pool = list(pool_index)
+        return merged
 
     def serialize(self, path: Path) -> None:
-        """Serialize the trie to a binary file."""
-        with Path(path).open("wb") as f:
-            pickle.dump(self.root, f, protocol=pickle.HIGHEST_PROTOCOL)
+        """Minimize the trie into a DAWG and write it to a binary file."""
+        trie = self.trie.minimized()
+        print(f"  Merged shared suffixes: {self.trie.node_count} -> {trie.node_count} nodes")
+        trie.write(path)
         print(f"Serialized {self.word_count} words to {path}")
 
 
-def load_word_list(path: Path) -> set[str]:
+def load_word_list(path: Path) -> list[str]:
     """Load words from a simple word list file (one word per line).
 
     Args:
-        path: Path to the word list file.
+        path: Path to the word list file, optionally gzip-compressed (``.gz``).
 
     Returns:
-        Set of lowercase words.
+        Distinct lowercase words in file order (alphabetical for words_alpha.txt).
     """
-    words = set()
-    with Path(path).open(encoding="utf-8") as f:
-        for line in f:
-            word = line.strip().lower()
-            if word and re.match(r"^[a-z]+$", word):
-                words.add(word)
-    return words
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        lines = f.read().lower().splitlines()
+    # isascii() + isalpha() is the C-level equivalent of matching ^[a-z]+$
+    return list(dict.fromkeys(word for word in map(str.strip, lines) if word.isascii() and word.isalpha()))
 
 
 def load_coca_frequencies(path: Path) -> dict[str, int]:
@@ -93,20 +142,14 @@ def load_coca_frequencies(path: Path) -> dict[str, int]:
     Returns:
         Dictionary mapping words to their frequency rank.
     """
-    frequencies: dict[str, int] = {}
     if not path.exists():
         print(f"Warning: COCA file not found at {path}")
         print("Proceeding without frequency filtering...")
-        return frequencies
+        return {}
 
-    with Path(path).open(encoding="utf-8") as f:
-        for rank, line in enumerate(f, start=1):
-            parts = line.strip().split(",")
-            if parts:
-                word = parts[0].lower().strip()
-                if word:
-                    frequencies[word] = rank
-    return frequencies
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    return {word: rank for rank, row in enumerate(rows, start=1) if row and (word := row[0].strip().lower())}
 
 
 def load_blocklist(path: Path) -> set[str]:
@@ -126,79 +169,227 @@ def load_blocklist(path: Path) -> set[str]:
         return {line.strip().lower() for line in f if line.strip()}
 
 
-def get_wordnet_definition(word: str) -> str | None:
+@functools.cache
+def get_wordnet() -> WordNetCorpusReader:
+    """Return the WordNet reader, downloading the corpus on first use.
+
+    nltk is imported here rather than at module load, and corpus presence is
+    checked with nltk.data.find instead of a warm-up query, so runs that
+    never reach the enrichment step (e.g. a build cache hit) skip WordNet
+    entirely.
+
+    Returns:
+        The nltk WordNet corpus reader.
+    """
+    import nltk
+    from nltk.corpus import wordnet
+
+    try:
+        nltk.data.find("corpora/wordnet")
+    except LookupError:
+        nltk.download("wordnet")
+        nltk.download("omw-1.4")
+    return wordnet
+
+
+def load_wordnet_definitions() -> dict[str, str]:
+    """Map every single-word WordNet lemma to its primary definition.
+
+    Reads each part-of-speech data file once instead of querying WordNet per
+    word. Parts of speech are visited in the order ``wn.synsets`` returns
+    them, and within one the synset where the lemma is the head word with the
+    lowest sense number wins, approximating ``wn.synsets(word)[0]``.
+
+    Returns:
+        Dictionary mapping lowercase lemmas to definitions.
+    """
+    wn = get_wordnet()
+    ranked: dict[str, tuple[tuple[int, int], str]] = {}
+    for pos_rank, pos in enumerate(WORDNET_POS_ORDER):
+        for synset in wn.all_synsets(pos):
+            head, _, sense = synset.name().rsplit(".", 2)
+            definition = synset.definition()
+            for lemma in synset.lemma_names():
+                if not lemma.isalpha():
+                    continue
+                key = lemma.lower()
+                rank = (pos_rank, int(sense) if key == head.lower() else UNRANKED_SENSE)
+                current = ranked.get(key)
+                if current is None or rank < current[0]:
+                    ranked[key] = (rank, definition)
+    return {lemma: definition for lemma, (_, definition) in ranked.items()}
+
+
+def get_wordnet_definition(word: str, lemma_definitions: dict[str, str]) -> str | None:
     """Get the primary WordNet definition for a word.
 
+    Inflected forms (e.g. "remarries") fall back to their base form via
+    ``wn.morphy``, which only consults in-memory exception lists and indexes.
+
     Args:
         word: The word to look up.
+        lemma_definitions: Mapping from ``load_wordnet_definitions``.
 
     Returns:
         The definition string, or None if not found.
     """
-    synsets = wn.synsets(word)
-    if synsets:
-        return synsets[0].definition()
-    return None
+    definition = lemma_definitions.get(word)
+    if definition is None:
+        base = get_wordnet().morphy(word)
+        if base is not None:
+            definition = lemma_definitions.get(base)
+    return definition
+
+
+# Lemma definitions shared by every bucket worker, set once per process
+_worker_lemma_definitions: dict[str, str] = {}
+
+
+def _init_bucket_worker(lemma_definitions: dict[str, str]) -> None:
+    """Store the lemma definitions in a worker process."""
+    _worker_lemma_definitions.update(lemma_definitions)
+
+
+def _build_bucket(words: list[str]) -> DictionaryBuilder:
+    """Build the sub-trie for words that share a first letter.
+
+    Args:
+        words: Words to add, in sorted order.
+
+    Returns:
+        A builder holding just these words.
+    """
+    builder = DictionaryBuilder()
+    for word in words:
+        builder.add_word(word, get_wordnet_definition(word, _worker_lemma_definitions))
+    return builder
+
+
+def compute_build_hash() -> str:
+    """Hash everything the build output depends on.
+
+    Covers the raw input files, the filtering configuration, and the source
+    of this script and the trie module, so a change to any of them forces a
+    rebuild. Missing optional inputs hash as absent.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"min_word_length": MIN_WORD_LENGTH, "max_coca_rank": MAX_COCA_RANK}).encode())
+    for path in (
+        WORD_LIST_PATH,
+        PLAIN_WORD_LIST_PATH,
+        COCA_PATH,
+        BLOCKLIST_PATH,
+        Path(__file__),
+        Path(dictionary_module.__file__),
+    ):
+        digest.update(path.name.encode())
+        if path.exists():
+            with path.open("rb") as f:
+                digest.update(hashlib.file_digest(f, "sha256").digest())
+        else:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def is_build_current(build_hash: str) -> bool:
+    """Check whether the existing output was built from the same inputs.
 
+    Args:
+        build_hash: Hash from ``compute_build_hash``.
+
+    Returns:
+        True if the output and a manifest with a matching hash both exist.
+    """
+    if not (OUTPUT_PATH.exists() and MANIFEST_PATH.exists()):
+        return False
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return manifest.get("hash") == build_hash
 
-def build_dictionary() -> None:
+
+def build_dictionary(*, force: bool = False) -> None:
     """Execute the full dictionary build pipeline.
 
+    Skips the build when the output is already up to date with its inputs.
+
+    Args:
+        force: Rebuild even if the manifest says the output is current.
+
     Raises:
         FileNotFoundError: If word list file is not found.
     """
     print("=== Dictionary Build Pipeline ===\n")
 
     # Step 1: Load word list
-    word_list_path = RAW_DIR / "english-words.txt"
+    word_list_path = WORD_LIST_PATH if WORD_LIST_PATH.exists() else PLAIN_WORD_LIST_PATH
     if not word_list_path.exists():
-        message = f"Word list file not found at {word_list_path}. Run download_sources.py first."
+        message = f"Word list file not found at {WORD_LIST_PATH}. Run download_sources.py first."
         raise FileNotFoundError(message)
 
+    build_hash = compute_build_hash()
+    if not force and is_build_current(build_hash):
+        print(f"Cache hit: {OUTPUT_PATH} is up to date (use --force to rebuild)")
+        return
+
     print("Step 1: Loading word list...")
     source_words = load_word_list(word_list_path)
     print(f"  Loaded {len(source_words)} raw words")
 
-    # Step 2: Filter by length
+    # Steps 2-4: Filter by length, COCA frequency (if available) and blocklist.
+    # All three run in one order-preserving pass so the list stays sorted for
+    # trie insertion; per-step counts are tallied along the way for reporting.
+    coca_freqs = load_coca_frequencies(COCA_PATH)
+    top_coca = frozenset(w for w, rank in coca_freqs.items() if rank <= MAX_COCA_RANK) if coca_freqs else None
+    blocklist = load_blocklist(BLOCKLIST_PATH)
+
+    words: list[str] = []
+    too_short = infrequent = blocked = 0
+    for word in source_words:
+        if len(word) < MIN_WORD_LENGTH:
+            too_short += 1
+        elif top_coca is not None and word not in top_coca:
+            infrequent += 1
+        elif word in blocklist:
+            blocked += 1
+        else:
+            words.append(word)
+
+    remaining = len(source_words) - too_short
     print(f"\nStep 2: Filtering words < {MIN_WORD_LENGTH} letters...")
-    words = {w for w in source_words if len(w) >= MIN_WORD_LENGTH}
-    print(f"  Remaining: {len(words)} words")
+    print(f"  Remaining: {remaining} words")
 
-    # Step 3: Filter by COCA frequency (if available)
     print("\nStep 3: Filtering by COCA frequency...")
-    coca_path = RAW_DIR / "coca-frequencies.csv"
-    coca_freqs = load_coca_frequencies(coca_path)
-
-    if coca_freqs:
-        words = {w for w in words if coca_freqs.get(w, MAX_COCA_RANK + 1) <= MAX_COCA_RANK}
-        print(f"  Remaining: {len(words)} words (top {MAX_COCA_RANK} frequency)")
+    if top_coca is not None:
+        remaining -= infrequent
+        print(f"  Remaining: {remaining} words (top {MAX_COCA_RANK} frequency)")
     else:
         print("  Skipped (no COCA data)")
 
-    # Step 4: Remove blocklisted words
     print("\nStep 4: Removing blocklisted words...")
-    blocklist_path = RAW_DIR / "blocklist.txt"
-    blocklist = load_blocklist(blocklist_path)
-    words -= blocklist
     print(f"  Remaining: {len(words)} words")
 
-    # Step 5: Enrich with WordNet definitions
+    # Step 5: Enrich with WordNet definitions, building one sub-trie per first letter in parallel
     print("\nStep 5: Enriching with WordNet definitions...")
-    builder = DictionaryBuilder()
-    words_with_defs = 0
+    lemma_definitions = load_wordnet_definitions()
+    buckets: dict[str, list[str]] = {}
+    for word in words:
+        buckets.setdefault(word[0], []).append(word)
 
-    for word in sorted(words):
-        definition = get_wordnet_definition(word)
-        builder.add_word(word, definition)
-        if definition:
-            words_with_defs += 1
+    with ProcessPoolExecutor(initializer=_init_bucket_worker, initargs=(lemma_definitions,)) as executor:
+        builder = DictionaryBuilder.merge(list(executor.map(_build_bucket, buckets.values())))
 
-    print(f"  Words with definitions: {words_with_defs}/{len(words)}")
+    print(f"  Words with definitions: {builder.words_with_defs}/{len(words)}")
 
     # Step 6: Serialize
     print("\nStep 6: Serializing trie...")
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     builder.serialize(OUTPUT_PATH)
+    MANIFEST_PATH.write_text(json.dumps({"hash": build_hash, "words": builder.word_count}), encoding="utf-8")
 
     print("\n=== Build Complete ===")
     print(f"Output: {OUTPUT_PATH}")
@@ -206,4 +397,4 @@ def build_dictionary() -> None:
 
 
 if __name__ == "__main__":
-    build_dictionary()
+    build_dictionary(force="--force" in sys.argv[1:])
@@ -5,7 +5,10 @@ Usage:
     python backend/scripts/download_sources.py
 """
 
+import gzip
+import shutil
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
@@ -13,26 +16,53 @@ RAW_DIR = Path(__file__).parent.parent / "data" / "raw"
 # Use the english-words repository which has a clean word list
 WORD_LIST_URL = "https://github.com/dwyl/english-words/raw/master/words_alpha.txt"
 
+# (url, filename in RAW_DIR) for every source that can be fetched automatically.
+# Filenames ending in .gz are gzip-compressed as they stream to disk.
+SOURCES = [
+    (WORD_LIST_URL, "english-words.txt.gz"),
+]
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _download_one(url: str, output_path: Path) -> None:
+    """Stream a single source to disk.
+
+    Writes to a temporary file first so an interrupted download never leaves
+    a partial file that looks complete on the next run. Compresses on the fly
+    when ``output_path`` ends in ``.gz``.
+
+    Args:
+        url: Source URL.
+        output_path: Destination file path.
+    """
+    if output_path.exists():
+        print(f"{output_path.name} already exists at {output_path}")
+        return
+
+    print(f"Downloading {url} to {output_path}...")
+    partial_path = output_path.with_name(output_path.name + ".part")
+    with urllib.request.urlopen(url) as response, partial_path.open("wb") as f:  # noqa: S310 - fixed https URLs
+        if output_path.suffix == ".gz":
+            with gzip.GzipFile(filename=output_path.stem, mode="wb", fileobj=f, compresslevel=6) as compressed:
+                shutil.copyfileobj(response, compressed, length=DOWNLOAD_CHUNK_SIZE)
+        else:
+            shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+    partial_path.replace(output_path)
+    print(f"Done: {output_path.name}")
+
 
 def download_word_list() -> None:
-    """Download english word list.
+    """Download all automatically available sources concurrently.
 
     Raises:
         FileNotFoundError: If download fails.
     """
     RAW_DIR.mkdir(parents=True, exist_ok=True)
-    output_path = RAW_DIR / "english-words.txt"
-
-    if output_path.exists():
-        print(f"Word list already exists at {output_path}")
-        return
-
-    print(f"Downloading English word list to {output_path}...")
-    print(f"Source: {WORD_LIST_URL}")
 
     try:
-        urllib.request.urlretrieve(WORD_LIST_URL, output_path)
-        print("Done.")
+        with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+            list(executor.map(lambda source: _download_one(source[0], RAW_DIR / source[1]), SOURCES))
     except Exception as e:
         print(f"Error downloading: {e}")
         message = "Failed to download word list. You can download manually from: https://github.com/dwyl/english-words"
@@ -3,7 +3,7 @@
 set -e
 set -x
 
-coverage run -m pytest tests/
+pytest --cov --cov-report= -n auto --dist=loadscope tests/
 coverage report
 coverage html --title "${@-coverage}"
 coverage xml
@@ -1,78 +1,70 @@
 """Tests for game API endpoints."""
 
 import json
+import uuid
 from datetime import UTC, date, datetime
-from unittest.mock import patch
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
-from app.models import GameSession, Player, Puzzle
+from app.models import GameSession, LeaderboardEntry, Player, Puzzle
+from app.services.name_generator import ADJECTIVES, NOUNS, generate_player_name, generate_unique_player_name
+
+# --- Sample data ---
+
+SAMPLE_TILES: tuple[dict, ...] = (
+    {"id": 0, "letters": "CH"},
+    {"id": 1, "letters": "UB"},
+    {"id": 2, "letters": "BY"},
+    {"id": 3, "letters": "PE"},
+    {"id": 4, "letters": "NG"},
+    {"id": 5, "letters": "UI"},
+    {"id": 6, "letters": "NI"},
+    {"id": 7, "letters": "CO"},
+    {"id": 8, "letters": "RN"},
+    {"id": 9, "letters": "WA"},
+    {"id": 10, "letters": "LF"},
+    {"id": 11, "letters": "LS"},
+    {"id": 12, "letters": "DO"},
+    {"id": 13, "letters": "PH"},
+    {"id": 14, "letters": "IN"},
+    {"id": 15, "letters": "AL"},
+    {"id": 16, "letters": "ES"},
+    {"id": 17, "letters": "KA"},
+    {"id": 18, "letters": "TE"},
+    {"id": 19, "letters": "ST"},
+)
+QUARTILE_WORDS = ("CHUBBY", "PENGUIN", "UNICORN", "WALRUS", "NARWHAL")
+VALID_WORDS = (*QUARTILE_WORDS, "PEN", "GUIN", "CORN", "HORN", "WAL", "RUS")
+
+# Serialized once at import; every sample_puzzle row reuses the same payloads
+SAMPLE_TILES_JSON = json.dumps(SAMPLE_TILES)
+QUARTILE_WORDS_JSON = json.dumps(QUARTILE_WORDS)
+VALID_WORDS_JSON = json.dumps(VALID_WORDS)
+
+# Identifiers that never match a row, for the not-found tests
+MISSING_ID = uuid.UUID(int=0)
+FUTURE_DATE = date(2099, 12, 31)
+
+# Taken once at import. It stays close to the real clock because submit
+# stores now - start_time in a 32-bit solve_time_ms column.
+NOW = datetime.now(UTC)
 
 # --- Fixtures ---
 
 
-@pytest.fixture(scope="session")
-def sample_tiles() -> list[dict]:
-    """Create sample tile data.
-
-    Returns:
-        list[dict]: Sample tile data with id and letters.
-    """
-    return [
-        {"id": 0, "letters": "CH"},
-        {"id": 1, "letters": "UB"},
-        {"id": 2, "letters": "BY"},
-        {"id": 3, "letters": "PE"},
-        {"id": 4, "letters": "NG"},
-        {"id": 5, "letters": "UI"},
-        {"id": 6, "letters": "NI"},
-        {"id": 7, "letters": "CO"},
-        {"id": 8, "letters": "RN"},
-        {"id": 9, "letters": "WA"},
-        {"id": 10, "letters": "LF"},
-        {"id": 11, "letters": "LS"},
-        {"id": 12, "letters": "DO"},
-        {"id": 13, "letters": "PH"},
-        {"id": 14, "letters": "IN"},
-        {"id": 15, "letters": "AL"},
-        {"id": 16, "letters": "ES"},
-        {"id": 17, "letters": "KA"},
-        {"id": 18, "letters": "TE"},
-        {"id": 19, "letters": "ST"},
-    ]
-
-
 @pytest.fixture
-def sample_puzzle(session: Session, sample_tiles: list[dict]) -> Puzzle:
+def sample_puzzle(session: Session) -> Puzzle:
     """Create a sample puzzle in the database.
 
     Args:
         session: Database session.
-        sample_tiles: Sample tile data.
 
     Returns:
         Puzzle: A sample puzzle with test data.
     """
-    import uuid
-
-    quartile_words = ["CHUBBY", "PENGUIN", "UNICORN", "WALRUS", "NARWHAL"]
-    valid_words = [
-        "CHUBBY",
-        "PENGUIN",
-        "UNICORN",
-        "WALRUS",
-        "NARWHAL",
-        "PEN",
-        "GUIN",
-        "CORN",
-        "HORN",
-        "WAL",
-        "RUS",
-    ]
-
     # Use a fixed test date that won't conflict with the puzzle scheduler
     # The scheduler creates puzzles for today, so use a date in the past
     test_date = date(2024, 1, 1)
@@ -80,14 +72,13 @@ def sample_puzzle(session: Session, sample_tiles: list[dict]) -> Puzzle:
     puzzle = Puzzle(
         id=uuid.uuid4(),
         date=test_date,
-        tiles_json=json.dumps(sample_tiles),
-        quartile_words_json=json.dumps(quartile_words),
-        valid_words_json=json.dumps(valid_words),
+        tiles_json=SAMPLE_TILES_JSON,
+        quartile_words_json=QUARTILE_WORDS_JSON,
+        valid_words_json=VALID_WORDS_JSON,
         total_available_points=150,
     )
     session.add(puzzle)
     session.commit()
-    session.refresh(puzzle)
     return puzzle
 
 
@@ -101,8 +92,6 @@ def sample_player(session: Session) -> Player:
     Returns:
         Player: A sample player with test data.
     """
-    import uuid
-
     player = Player(
         id=uuid.uuid4(),
         display_name="TestPlayer",
@@ -110,7 +99,6 @@ def sample_player(session: Session) -> Player:
     )
     session.add(player)
     session.commit()
-    session.refresh(player)
     return player
 
 
@@ -126,13 +114,11 @@ def sample_session(session: Session, sample_puzzle: Puzzle, sample_player: Playe
     Returns:
         GameSession: A sample game session with test data.
     """
-    import uuid
-
     game_session = GameSession(
         id=uuid.uuid4(),
         puzzle_id=sample_puzzle.id,
         player_id=sample_player.id,
-        start_time=datetime.now(UTC),
+        start_time=NOW,
         final_score=0,
         hints_used=0,
         hint_penalty_ms=0,
@@ -140,17 +126,31 @@ def sample_session(session: Session, sample_puzzle: Puzzle, sample_player: Playe
     )
     session.add(game_session)
     session.commit()
-    session.refresh(game_session)
     return game_session
 
 
+@pytest.fixture
+def completed_session(session: Session, sample_session: GameSession) -> GameSession:
+    """Mark the sample game session as completed.
+
+    Args:
+        session: Database session.
+        sample_session: Sample game session.
+
+    Returns:
+        GameSession: The sample game session with completed_at set.
+    """
+    sample_session.completed_at = NOW
+    session.add(sample_session)
+    session.commit()
+    return sample_session
+
+
 class TestNameGenerator:
     """Tests for name generator service."""
 
     def test_generate_player_name(self) -> None:
         """Test that generate_player_name creates valid names."""
-        from app.services.name_generator import generate_player_name
-
         name = generate_player_name()
         assert isinstance(name, str)
         assert len(name) > 0
@@ -160,8 +160,6 @@ class TestNameGenerator:
 
     def test_generate_unique_player_name(self) -> None:
         """Test that generate_unique_player_name avoids conflicts."""
-        from app.services.name_generator import generate_unique_player_name
-
         existing_names = {"ChubbyPenguin", "SleepyMango"}
         name = generate_unique_player_name(existing_names)
         assert name is not None
@@ -169,31 +167,30 @@ class TestNameGenerator:
 
     def test_generate_unique_player_name_exhausted(self) -> None:
         """Test that generate_unique_player_name returns None when exhausted."""
-        from app.services.name_generator import generate_unique_player_name
-
-        # Create a set that's likely to cause collision
-        existing_names_set: set[str] = {
-            name for name in (generate_unique_player_name(set()) for _ in range(100)) if name is not None
-        }
-        # Try to generate with very few attempts
-        # This might return None if collision occurs
-        _ = generate_unique_player_name(existing_names_set, max_attempts=2)
+        # Every possible name is taken, so no attempt can succeed
+        all_names = {f"{adjective}{noun}" for adjective in ADJECTIVES for noun in NOUNS}
+        assert generate_unique_player_name(all_names, max_attempts=2) is None
 
 
 class TestGameStart:
     """Tests for POST /game/start endpoint."""
 
-    def test_start_new_game(self, client: TestClient, sample_puzzle: Puzzle) -> None:
+    def test_start_new_game(
+        self,
+        client: TestClient,
+        sample_puzzle: Puzzle,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test starting a new game session."""
-        # Mock ensure_puzzle_exists_for_date to return our sample puzzle
-        with patch(
+        # Stub ensure_puzzle_exists_for_date to return our sample puzzle
+        monkeypatch.setattr(
             "app.api.routes.game.ensure_puzzle_exists_for_date",
-            return_value=sample_puzzle,
-        ):
-            response = client.post(
-                "/api/v1/game/start",
-                json={"device_fingerprint": "test-device-123"},
-            )
+            lambda *_args, **_kwargs: sample_puzzle,
+        )
+        response = client.post(
+            "/api/v1/game/start",
+            json={"device_fingerprint": "test-device-123"},
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -213,19 +210,20 @@ class TestGameStart:
         client: TestClient,
         sample_puzzle: Puzzle,
         sample_player: Player,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test starting a game with a returning player."""
-        with patch(
+        monkeypatch.setattr(
             "app.api.routes.game.ensure_puzzle_exists_for_date",
-            return_value=sample_puzzle,
-        ):
-            response = client.post(
-                "/api/v1/game/start",
-                json={
-                    "device_fingerprint": sample_player.device_fingerprint,
-                    "player_id": str(sample_player.id),
-                },
-            )
+            lambda *_args, **_kwargs: sample_puzzle,
+        )
+        response = client.post(
+            "/api/v1/game/start",
+            json={
+                "device_fingerprint": sample_player.device_fingerprint,
+                "player_id": str(sample_player.id),
+            },
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -238,16 +236,15 @@ class TestGameStart:
         sample_puzzle: Puzzle,
         sample_player: Player,
         session: Session,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test starting a game when player already completed today's puzzle."""
-        from app.models import GameSession
-
         # Create a completed session
         completed_session = GameSession(
             puzzle_id=sample_puzzle.id,
             player_id=sample_player.id,
-            start_time=datetime.now(UTC),
-            completed_at=datetime.now(UTC),
+            start_time=NOW,
+            completed_at=NOW,
             solve_time_ms=60000,
             final_score=100,
             hints_used=0,
@@ -257,17 +254,17 @@ class TestGameStart:
         session.add(completed_session)
         session.commit()
 
-        with patch(
+        monkeypatch.setattr(
             "app.api.routes.game.ensure_puzzle_exists_for_date",
-            return_value=sample_puzzle,
-        ):
-            response = client.post(
-                "/api/v1/game/start",
-                json={
-                    "device_fingerprint": sample_player.device_fingerprint,
-                    "player_id": str(sample_player.id),
-                },
-            )
+            lambda *_args, **_kwargs: sample_puzzle,
+        )
+        response = client.post(
+            "/api/v1/game/start",
+            json={
+                "device_fingerprint": sample_player.device_fingerprint,
+                "player_id": str(sample_player.id),
+            },
+        )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -283,12 +280,10 @@ class TestWordValidation:
         self,
         client: TestClient,
         sample_session: GameSession,
-        sample_puzzle: Puzzle,
     ) -> None:
         """Test validating a valid word."""
-        # Get a valid word from the puzzle
-        valid_words = json.loads(sample_puzzle.valid_words_json)
-        test_word = valid_words[0]
+        # Get a valid word from the sample puzzle
+        test_word = VALID_WORDS[0]
 
         response = client.post(
             f"/api/v1/game/sessions/{sample_session.id}/word",
@@ -322,12 +317,10 @@ class TestWordValidation:
         self,
         client: TestClient,
         sample_session: GameSession,
-        sample_puzzle: Puzzle,
         session: Session,
     ) -> None:
         """Test validating a word that was already found."""
-        valid_words = json.loads(sample_puzzle.valid_words_json)
-        test_word = valid_words[0]
+        test_word = VALID_WORDS[0]
 
         # Add word to found words
         sample_session.words_found_json = json.dumps([test_word])
@@ -348,36 +341,16 @@ class TestWordValidation:
     def test_validate_word_completed_session(
         self,
         client: TestClient,
-        sample_session: GameSession,
-        session: Session,
+        completed_session: GameSession,
     ) -> None:
         """Test validating a word for a completed session."""
-        sample_session.completed_at = datetime.now(UTC)
-        session.add(sample_session)
-        session.commit()
-
         response = client.post(
-            f"/api/v1/game/sessions/{sample_session.id}/word",
+            f"/api/v1/game/sessions/{completed_session.id}/word",
             json={"word": "TEST"},
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_validate_word_session_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """Test validating a word for a non-existent session."""
-        import uuid
-
-        fake_id = uuid.uuid4()
-        response = client.post(
-            f"/api/v1/game/sessions/{fake_id}/word",
-            json={"word": "TEST"},
-        )
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
 
 class TestGameSubmit:
     """Tests for POST /game/sessions/{id}/submit endpoint."""
@@ -419,34 +392,21 @@ class TestGameSubmit:
     def test_submit_already_submitted(
         self,
         client: TestClient,
-        sample_session: GameSession,
+        completed_session: GameSession,
         session: Session,
     ) -> None:
         """Test submitting a game that was already submitted."""
-        sample_session.completed_at = datetime.now(UTC)
-        sample_session.solve_time_ms = 60000
-        session.add(sample_session)
+        completed_session.solve_time_ms = 60000
+        session.add(completed_session)
         session.commit()
 
-        response = client.post(f"/api/v1/game/sessions/{sample_session.id}/submit")
+        response = client.post(f"/api/v1/game/sessions/{completed_session.id}/submit")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["success"] is False
         assert "already submitted" in data["message"].lower()
 
-    def test_submit_session_not_found(
-        self,
-        client: TestClient,
-    ) -> None:
-        """Test submitting a non-existent session."""
-        import uuid
-
-        fake_id = uuid.uuid4()
-        response = client.post(f"/api/v1/game/sessions/{fake_id}/submit")
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
 
 class TestGetHint:
     """Tests for POST /game/sessions/{id}/hint endpoint."""
@@ -468,15 +428,10 @@ class TestGetHint:
     def test_get_hint_completed_session(
         self,
         client: TestClient,
-        sample_session: GameSession,
-        session: Session,
+        completed_session: GameSession,
     ) -> None:
         """Test getting a hint for a completed session."""
-        sample_session.completed_at = datetime.now(UTC)
-        session.add(sample_session)
-        session.commit()
-
-        response = client.post(f"/api/v1/game/sessions/{sample_session.id}/hint")
+        response = client.post(f"/api/v1/game/sessions/{completed_session.id}/hint")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -496,15 +451,26 @@ class TestGetHint:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "maximum" in response.json()["detail"].lower()
 
-    def test_get_hint_session_not_found(
+
+class TestSessionNotFound:
+    """Tests for session endpoints called with an unknown session id."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "payload"),
+        [
+            ("word", {"word": "TEST"}),
+            ("submit", None),
+            ("hint", None),
+        ],
+    )
+    def test_session_not_found(
         self,
         client: TestClient,
+        endpoint: str,
+        payload: dict | None,
     ) -> None:
-        """Test getting a hint for a non-existent session."""
-        import uuid
-
-        fake_id = uuid.uuid4()
-        response = client.post(f"/api/v1/game/sessions/{fake_id}/hint")
+        """Test that each session endpoint returns 404 for a non-existent session."""
+        response = client.post(f"/api/v1/game/sessions/{MISSING_ID}/{endpoint}", json=payload)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -516,13 +482,14 @@ class TestPuzzleEndpoints:
         self,
         client: TestClient,
         sample_puzzle: Puzzle,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test getting today's puzzle."""
-        with patch(
+        monkeypatch.setattr(
             "app.api.routes.puzzle.ensure_puzzle_exists_for_date",
-            return_value=sample_puzzle,
-        ):
-            response = client.get("/api/v1/puzzle/today")
+            lambda *_args, **_kwargs: sample_puzzle,
+        )
+        response = client.get("/api/v1/puzzle/today")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -551,8 +518,7 @@ class TestPuzzleEndpoints:
         client: TestClient,
     ) -> None:
         """Test getting puzzle for non-existent date."""
-        future_date = date(2099, 12, 31)
-        response = client.get(f"/api/v1/puzzle/{future_date}")
+        response = client.get(f"/api/v1/puzzle/{FUTURE_DATE}")
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
@@ -580,20 +546,19 @@ class TestLeaderboardEndpoints:
         session: Session,
     ) -> None:
         """Test getting the leaderboard for the sample puzzle's date."""
-        from app.models import LeaderboardEntry
-
         entry1 = LeaderboardEntry(
             puzzle_id=sample_puzzle.id,
             player_id=sample_player.id,
+            display_name=sample_player.display_name,
             solve_time_ms=30000,
         )
         entry2 = LeaderboardEntry(
             puzzle_id=sample_puzzle.id,
             player_id=sample_player.id,
+            display_name=sample_player.display_name,
             solve_time_ms=60000,
         )
-        session.add(entry1)
-        session.add(entry2)
+        session.add_all([entry1, entry2])
         session.commit()
 
         # Query the leaderboard for the sample puzzle's date
@@ -604,6 +569,7 @@ class TestLeaderboardEndpoints:
         assert len(data["entries"]) == 2
         assert data["entries"][0]["rank"] == 1
         assert data["entries"][0]["solve_time_ms"] == 30000
+        assert data["entries"][0]["display_name"] == sample_player.display_name
 
     def test_get_leaderboard_by_date(
         self,
@@ -613,11 +579,10 @@ class TestLeaderboardEndpoints:
         session: Session,
     ) -> None:
         """Test getting leaderboard by date."""
-        from app.models import LeaderboardEntry
-
         entry = LeaderboardEntry(
             puzzle_id=sample_puzzle.id,
             player_id=sample_player.id,
+            display_name=sample_player.display_name,
             solve_time_ms=45000,
         )
         session.add(entry)
@@ -638,11 +603,10 @@ class TestLeaderboardEndpoints:
         session: Session,
     ) -> None:
         """Test getting leaderboard with player_id filter."""
-        from app.models import LeaderboardEntry
-
         entry = LeaderboardEntry(
             puzzle_id=sample_puzzle.id,
             player_id=sample_player.id,
+            display_name=sample_player.display_name,
             solve_time_ms=45000,
         )
         session.add(entry)
@@ -662,15 +626,15 @@ class TestLeaderboardEndpoints:
         session: Session,
     ) -> None:
         """Test getting leaderboard with limit."""
-        from app.models import LeaderboardEntry
-
-        for i in range(10):
-            entry = LeaderboardEntry(
+        session.add_all(
+            LeaderboardEntry(
                 puzzle_id=sample_puzzle.id,
                 player_id=sample_player.id,
+                display_name=sample_player.display_name,
                 solve_time_ms=30000 + i * 1000,
             )
-            session.add(entry)
+            for i in range(10)
+        )
         session.commit()
 
         response = client.get(f"/api/v1/leaderboard/{sample_puzzle.date}?limit=5")
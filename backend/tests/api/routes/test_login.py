@@ -1,5 +1,4 @@
-from unittest.mock import patch
-
+import pytest
 from fastapi.testclient import TestClient
 from pwdlib.hashers.bcrypt import BcryptHasher
 from sqlmodel import Session
@@ -56,18 +55,22 @@ def test_use_access_token(client: TestClient, superuser_token_headers: dict[str,
     assert "email" in result
 
 
+@pytest.fixture
+def smtp_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure SMTP settings for the duration of a test."""
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(settings, "SMTP_USER", "admin@example.com")
+
+
+@pytest.mark.usefixtures("smtp_configured")
 def test_recovery_password(client: TestClient, normal_user_token_headers: dict[str, str]) -> None:
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
-    ):
-        email = "test@example.com"
-        r = client.post(
-            f"{settings.API_V1_STR}/password-recovery/{email}",
-            headers=normal_user_token_headers,
-        )
-        assert r.status_code == 200
-        assert r.json() == {"message": "If that email is registered, we sent a password recovery link"}
+    email = "test@example.com"
+    r = client.post(
+        f"{settings.API_V1_STR}/password-recovery/{email}",
+        headers=normal_user_token_headers,
+    )
+    assert r.status_code == 200
+    assert r.json() == {"message": "If that email is registered, we sent a password recovery link"}
 
 
 def test_recovery_password_user_not_exits(client: TestClient, normal_user_token_headers: dict[str, str]) -> None:
@@ -131,8 +134,9 @@ def test_login_with_bcrypt_password_upgrades_to_argon2(client: TestClient, sessi
     email = random_email()
     password = random_lower_string()
 
-    # Create a bcrypt hash directly (simulating legacy password)
-    bcrypt_hasher = BcryptHasher()
+    # Create a bcrypt hash directly (simulating legacy password), with the
+    # minimum cost since only the upgrade path is under test
+    bcrypt_hasher = BcryptHasher(rounds=4)
     bcrypt_hash = bcrypt_hasher.hash(password)
     assert bcrypt_hash.startswith("$2")  # bcrypt hashes start with $2
 
@@ -242,8 +246,6 @@ def test_reset_password_inactive_user(client: TestClient, session: Session) -> N
 
 def test_reset_password_user_not_found(client: TestClient, superuser_token_headers: dict[str, str]) -> None:
     """Test reset password with valid token but non-existent user."""
-    from app.utils import generate_password_reset_token
-
     # Generate token for email that doesn't exist in database
     email = "nonexistent@example.com"
     token = generate_password_reset_token(email=email)
@@ -2,11 +2,15 @@
 
 from fastapi.testclient import TestClient
 
+from app import crud
+from app.core.config import settings
+from app.models import UserCreate
+from tests.utils.user import user_authentication_headers
+from tests.utils.utils import random_email, random_lower_string
+
 
 def test_get_current_user_invalid_token(client: TestClient) -> None:
     """Test 403 on invalid token."""
-    from app.core.config import settings
-
     response = client.get(
         f"{settings.API_V1_STR}/users/me",
         headers={"Authorization": "Bearer invalid-token"},
@@ -16,8 +20,6 @@ def test_get_current_user_invalid_token(client: TestClient) -> None:
 
 def test_get_current_user_missing_token(client: TestClient) -> None:
     """Test 401/403 on missing token."""
-    from app.core.config import settings
-
     response = client.get(f"{settings.API_V1_STR}/users/me")
     # Should get 401 or 403 depending on OAuth2 scheme
     assert response.status_code in (401, 403)
@@ -25,12 +27,6 @@ def test_get_current_user_missing_token(client: TestClient) -> None:
 
 def test_get_current_active_superuser_normal_user(client: TestClient, session) -> None:
     """Test normal user cannot access superuser endpoints."""
-    from app import crud
-    from app.core.config import settings
-    from app.models import UserCreate
-    from tests.utils.user import user_authentication_headers
-    from tests.utils.utils import random_email, random_lower_string
-
     # Create normal user
     email = random_email()
     password = random_lower_string()
@@ -1,28 +1,13 @@
 """Tests for API router configuration."""
 
+import pytest
 
-def test_api_router_includes_login_router() -> None:
-    """Test login router is always included."""
-    import app.api.main
+import app.api.main
 
-    routes = [getattr(route, "path", "") for route in app.api.main.api_router.routes]
-    # Login router should always be included
-    assert any("/login" in str(route) for route in routes)
+ROUTE_PATHS = tuple(str(getattr(route, "path", "")) for route in app.api.main.api_router.routes)
 
 
-def test_api_router_includes_users_router() -> None:
-    """Test users router is always included."""
-    import app.api.main
-
-    routes = [getattr(route, "path", "") for route in app.api.main.api_router.routes]
-    # Users router should always be included
-    assert any("/users" in str(route) for route in routes)
-
-
-def test_api_router_includes_utils_router() -> None:
-    """Test utils router is always included."""
-    import app.api.main
-
-    routes = [getattr(route, "path", "") for route in app.api.main.api_router.routes]
-    # Utils router should always be included
-    assert any("/utils" in str(route) for route in routes)
+@pytest.mark.parametrize("prefix", ["/login", "/users", "/utils"])
+def test_api_router_includes_router(prefix: str) -> None:
+    """Test the login, users and utils routers are always included."""
+    assert any(prefix in path for path in ROUTE_PATHS)
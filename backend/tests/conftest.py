@@ -3,13 +3,19 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+from sqlalchemy import Engine, text
+from sqlmodel import Session, SQLModel, create_engine
 
 # Set test environment before importing app modules
 os.environ["ENVIRONMENT"] = "test"
 
+from app.core import db as core_db
+from app.core import security
 from app.core.config import settings
-from app.core.db import engine, init_db
+from app.core.db import init_db
 from app.main import app
 from app.models import (
     GameSession,
@@ -23,19 +29,56 @@ from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
 
-@pytest.fixture(name="engine")
-def engine_fixture() -> Generator:
+def _create_worker_engine(worker_id: str) -> Engine:
+    """Create an engine on a database owned by one pytest-xdist worker.
+
+    The database sits next to the configured one and is dropped and
+    recreated every session, so its tables always match the current
+    SQLModel metadata.
+
+    Args:
+        worker_id: The xdist worker id, e.g. "gw0".
+
+    Returns:
+        Engine: SQLAlchemy engine bound to the worker's database.
+    """
+    database = f"{core_db.engine.url.database}_{worker_id}"
+    with core_db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+        connection.execute(text(f'CREATE DATABASE "{database}"'))
+
+    worker_engine = create_engine(core_db.engine.url.set(database=database))
+    SQLModel.metadata.create_all(worker_engine)
+    return worker_engine
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture() -> Generator[Engine]:
     """Create a PostgreSQL engine for tests.
 
     Each test runs in its own transaction that gets rolled back,
     ensuring complete test isolation while using production-like
     PostgreSQL database with proper UUID support.
 
-    Returns:
+    Under pytest-xdist (``pytest -n auto``) every worker gets its own
+    database, so workers never wait on each other's uncommitted rows,
+    such as the sample puzzle that every game test inserts for one date.
+
+    Yields:
         Engine: SQLAlchemy engine for database operations.
     """
-    # Use production PostgreSQL engine
-    return engine
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        # Use production PostgreSQL engine
+        yield core_db.engine
+        return
+
+    worker_engine = _create_worker_engine(worker_id)
+    # Code that opens its own sessions imports app.core.db.engine lazily
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(core_db, "engine", worker_engine)
+        yield worker_engine
+    worker_engine.dispose()
 
 
 @pytest.fixture(name="session")
@@ -55,12 +98,13 @@ def session_fixture(engine) -> Generator[Session]:
     connection = engine.connect()
     transaction = connection.begin()
 
-    # Create a session bound to this connection/transaction
-    session = Session(bind=connection)
-
-    # Initialize the database with the superuser
-    init_db(session)
+    # Create a session bound to this connection/transaction. Commits and
+    # rollbacks inside the test release or revert a SAVEPOINT, so the
+    # outer transaction stays open until teardown.
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
+    # The superuser is committed once by cleanup_test_data, so there is
+    # nothing to initialize per test
     yield session
 
     # Close the session and rollback the transaction to undo any changes
@@ -69,14 +113,29 @@ def session_fixture(engine) -> Generator[Session]:
     connection.close()
 
 
+@pytest.fixture(scope="session")
+def app_client() -> Generator[TestClient]:
+    """Create a test client shared by the whole test session.
+
+    Entering the client runs the application lifespan and starts the
+    event loop portal, so it is done once rather than for every test.
+
+    Yields:
+        TestClient: The shared test client for the FastAPI app.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(session: Session) -> Generator[TestClient]:
+def client(app_client: TestClient, session: Session) -> Generator[TestClient]:
     """Create a test client that uses the test database session.
 
     This fixture overrides the get_db dependency to use the test session,
     ensuring each test uses its own isolated database transaction.
 
     Args:
+        app_client: The shared test client.
         session: The test database session.
 
     Yields:
@@ -90,58 +149,137 @@ def client(session: Session) -> Generator[TestClient]:
 
     app.dependency_overrides[get_db] = override_get_db
     try:
-        with TestClient(app) as test_client:
-            yield test_client
+        yield app_client
     finally:
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_db, None)
+        app_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def token_headers_cache(
+    app_client: TestClient,
+    engine: Engine,
+    cleanup_test_data: None,
+) -> dict[str, dict[str, str]]:
+    """Log the superuser and the test user in once for the whole session.
+
+    Both users are committed here rather than inside a test transaction, so
+    their ids, and the tokens issued for them, stay valid in every test.
+
+    Args:
+        app_client: The shared test client.
+        engine: The database engine fixture.
+        cleanup_test_data: Ensures the superuser has been committed.
+
+    Returns:
+        Authorization headers keyed by user email.
+    """
+    _ = cleanup_test_data  # Used for fixture side-effect (superuser seeded)
+
+    def override_get_db() -> Generator[Session]:
+        with Session(engine) as db_session:
+            yield db_session
+
+    from app.api.deps import get_db
+
+    with Session(engine) as session:
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            return {
+                settings.FIRST_SUPERUSER: get_superuser_token_headers(app_client),
+                settings.EMAIL_TEST_USER: authentication_token_from_email(
+                    client=app_client, email=settings.EMAIL_TEST_USER, session=session
+                ),
+            }
+        finally:
+            app.dependency_overrides.pop(get_db, None)
 
 
 @pytest.fixture
-def superuser_token_headers(client: TestClient, session: Session) -> dict[str, str]:
+def superuser_token_headers(token_headers_cache: dict[str, dict[str, str]]) -> dict[str, str]:
     """Get superuser authentication headers.
 
-    The session parameter ensures the database is initialized with the superuser
-    before attempting to authenticate.
-
     Args:
-        client: The test client.
-        session: The test database session.
+        token_headers_cache: Headers issued once per test session.
 
     Returns:
         Dictionary with authorization headers for authenticated requests.
     """
-    _ = session  # Used for fixture side-effect (database initialization)
-    return get_superuser_token_headers(client)
+    return dict(token_headers_cache[settings.FIRST_SUPERUSER])
 
 
 @pytest.fixture
-def normal_user_token_headers(client: TestClient, session: Session) -> dict[str, str]:
+def normal_user_token_headers(token_headers_cache: dict[str, dict[str, str]]) -> dict[str, str]:
     """Get normal user authentication headers.
 
     Args:
-        client: The test client.
-        session: The test database session.
+        token_headers_cache: Headers issued once per test session.
 
     Returns:
         Dictionary with authorization headers for authenticated requests.
     """
-    return authentication_token_from_email(client=client, email=settings.EMAIL_TEST_USER, session=session)
+    return dict(token_headers_cache[settings.EMAIL_TEST_USER])
 
 
 @pytest.fixture(scope="session", autouse=True)
-def cleanup_test_data() -> None:
+def fast_password_hashing() -> Generator[None]:
+    """Use the cheapest password hashing parameters for the test session.
+
+    The tests check hashing behaviour, not its cost, so Argon2 runs with
+    the minimum memory and time cost and bcrypt with the minimum rounds.
+    Hashes are still real Argon2/bcrypt hashes, so the rehash and upgrade
+    logic goes through the same code path.
+
+    Yields:
+        None
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            security,
+            "password_hash",
+            PasswordHash(
+                (
+                    Argon2Hasher(time_cost=1, memory_cost=8, parallelism=1),
+                    BcryptHasher(rounds=4),
+                )
+            ),
+        )
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_test_data(engine: Engine, fast_password_hashing: None) -> None:
     """Clean up test data before all tests run.
 
     This fixture runs once before all tests to ensure any leftover
-    test data from previous runs is cleaned up.
+    test data from previous runs is cleaned up. It then commits the
+    superuser, so every test transaction starts with it in place.
+
+    Args:
+        engine: The database engine fixture.
+        fast_password_hashing: Ensures the superuser is hashed cheaply.
     """
-    # Clean up any existing test data before running tests
+    _ = fast_password_hashing  # Used for fixture side-effect (cheap hashing)
+    # Clean up any existing test data before running tests. A single
+    # TRUNCATE empties every table at once, and CASCADE takes care of the
+    # foreign key order.
+    tables = ", ".join(
+        f'"{model.__table__.name}"' for model in (GameSession, LeaderboardEntry, Player, QuartileCooldown, Puzzle, User)
+    )
+    with engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE TABLE {tables} CASCADE"))
+
     with Session(engine) as session:
-        # Delete in correct order (respect foreign keys)
-        session.exec(delete(GameSession))
-        session.exec(delete(LeaderboardEntry))
-        session.exec(delete(Player))
-        session.exec(delete(QuartileCooldown))
-        session.exec(delete(Puzzle))
-        session.exec(delete(User))
-        session.commit()
+        init_db(session)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run tests marked slow after all the others.
+
+    The sort is stable, so the collection order is otherwise unchanged and
+    quick failures surface before the real-dictionary integration tests.
+
+    Args:
+        items: The collected test items, reordered in place.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
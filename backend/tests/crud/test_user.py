@@ -98,8 +98,9 @@ def test_authenticate_user_with_bcrypt_upgrades_to_argon2(session: Session) -> N
     email = random_email()
     password = random_lower_string()
 
-    # Create a bcrypt hash directly (simulating legacy password)
-    bcrypt_hasher = BcryptHasher()
+    # Create a bcrypt hash directly (simulating legacy password), with the
+    # minimum cost since only the upgrade path is under test
+    bcrypt_hasher = BcryptHasher(rounds=4)
     bcrypt_hash = bcrypt_hasher.hash(password)
     assert bcrypt_hash.startswith("$2")  # bcrypt hashes start with $2
 
@@ -1,9 +1,16 @@
 """Shared fixtures for game module tests."""
 
+import contextlib
+import hashlib
+import tempfile
+from pathlib import Path
+
 import pytest
 
-from app.game.dictionary import Dictionary, TrieNode
+from app.game import generator, solver
+from app.game.dictionary import DEFAULT_DICTIONARY_PATH, Dictionary, FlatDictionary, FlatTrie, TrieNode
 from app.game.generator import generate_puzzle
+from app.game.solver import find_all_valid_words
 from app.game.types import Puzzle, Tile
 
 
@@ -99,29 +106,162 @@ def sample_puzzle(_sample_tiles: tuple[Tile, ...]) -> Puzzle:
 
 
 @pytest.fixture(scope="session")
-def real_dictionary() -> Dictionary:
+def dictionary_digest() -> str:
+    """Hash the real dictionary file, for keying cross-run caches.
+
+    Returns:
+        The SHA-256 hex digest of dictionary.bin.
+    """
+    with DEFAULT_DICTIONARY_PATH.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@pytest.fixture(scope="session")
+def real_dictionary(request: pytest.FixtureRequest, dictionary_digest: str) -> Dictionary:
     """Load the real dictionary for integration tests.
 
+    A legacy pickled dictionary.bin is unpickled once and also written to
+    pytest's cache in the flat trie format, keyed on its digest. Later runs
+    open that copy through Dictionary.load, which memory-maps it instead
+    of rebuilding every TrieNode. The copy is minimized first, which takes
+    a few extra seconds on a cold cache but shrinks it from about 120 MB to
+    about 40 MB under ``.pytest_cache/d/quartiles_dictionary``.
+
+    pytest-xdist workers can all find the cache cold at once. Each writes
+    its own temporary file and atomically renames it into place, so they
+    never share a partial file, and whichever rename lands last wins with
+    identical contents.
+
+    Args:
+        request: The pytest fixture request.
+        dictionary_digest: The digest of dictionary.bin.
+
+    Returns:
+        The Dictionary loaded from dictionary.bin or its cached flat copy.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return Dictionary.load()
+
+    cache_dir = cache.mkdir("quartiles_dictionary")
+    cached_path = cache_dir / f"{dictionary_digest}.bin"
+    if cached_path.exists():
+        # A copy written in an older trie format fails to load; rebuild it below
+        with contextlib.suppress(ValueError):
+            return Dictionary.load(cached_path)
+
+    dictionary = Dictionary.load()
+    if isinstance(dictionary, FlatDictionary):
+        return dictionary
+
+    trie = FlatTrie()
+    for word in dictionary.words_with_prefix(""):
+        trie.add_word(word, dictionary.get_definition(word))
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".part", delete=False) as partial:
+        partial_path = Path(partial.name)
+    try:
+        trie.minimized().write(partial_path)
+        partial_path.replace(cached_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+    # Drop copies of earlier dictionary versions. Another worker may be
+    # removing the same files, so a missing one is fine.
+    for stale in cache_dir.glob("*.bin"):
+        if stale != cached_path:
+            stale.unlink(missing_ok=True)
+    return dictionary
+
+
+GENERATED_PUZZLE_CACHE_KEY = "quartiles/generated_puzzle"
+
+
+def _generator_digest() -> str:
+    """Hash the generator and solver sources, for keying the cached puzzle.
+
     Returns:
-        The actual Dictionary instance from dictionary.bin.
+        The SHA-256 hex digest of app/game/generator.py and app/game/solver.py.
     """
-    return Dictionary.load()
+    digest = hashlib.sha256()
+    for module in (generator, solver):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
 
 
 @pytest.fixture(scope="session")
-def generated_puzzle(real_dictionary: Dictionary) -> Puzzle:
-    """Generate a puzzle once per test session for integration tests.
+def generated_puzzle(
+    request: pytest.FixtureRequest,
+    real_dictionary: Dictionary,
+    dictionary_digest: str,
+) -> Puzzle:
+    """Generate a puzzle once for integration tests.
 
-    This fixture generates a puzzle using the real dictionary and caches it
-    for the entire test session, significantly speeding up tests that need
-    a generated puzzle.
+    The puzzle is also stored in pytest's cache, keyed on the SHA-256 of
+    dictionary.bin and of the generator and solver sources, so later test
+    runs reuse it until the dictionary file or that code changes. Runs with the cache provider disabled generate it each time.
 
     Args:
+        request: The pytest fixture request.
         real_dictionary: The real dictionary fixture.
+        dictionary_digest: The digest of dictionary.bin.
 
     Returns:
         A Puzzle instance generated from the real dictionary.
     """
+    cache = getattr(request.config, "cache", None)
+    code_digest = _generator_digest()
+
+    cached = cache.get(GENERATED_PUZZLE_CACHE_KEY, None) if cache is not None else None
+    if cached is not None and cached["dictionary"] == dictionary_digest and cached.get("code") == code_digest:
+        return Puzzle(
+            tiles=tuple(Tile(id=tile_id, letters=letters) for tile_id, letters in cached["tiles"]),
+            quartile_words=tuple(cached["quartile_words"]),
+            valid_words=frozenset(cached["valid_words"]),
+            total_points=cached["total_points"],
+        )
+
     puzzle = generate_puzzle(real_dictionary, excluded_quartiles=set())
     assert puzzle is not None, "Failed to generate puzzle"
+    if cache is not None:
+        cache.set(
+            GENERATED_PUZZLE_CACHE_KEY,
+            {
+                "dictionary": dictionary_digest,
+                "code": code_digest,
+                "tiles": [[tile.id, tile.letters] for tile in puzzle.tiles],
+                "quartile_words": list(puzzle.quartile_words),
+                "valid_words": sorted(puzzle.valid_words),
+                "total_points": puzzle.total_points,
+            },
+        )
+    return puzzle
+
+
+@pytest.fixture(scope="session")
+def next_puzzle(generated_puzzle: Puzzle, real_dictionary: Dictionary) -> Puzzle:
+    """Generate a follow-up puzzle with the first puzzle's quartiles in cooldown.
+
+    Args:
+        generated_puzzle: The generated puzzle fixture.
+        real_dictionary: The real dictionary fixture.
+
+    Returns:
+        A Puzzle generated with generated_puzzle's quartile words excluded.
+    """
+    puzzle = generate_puzzle(real_dictionary, excluded_quartiles=set(generated_puzzle.quartile_words))
+    assert puzzle is not None, "Failed to generate puzzle"
     return puzzle
+
+
+@pytest.fixture(scope="session")
+def solved_words(generated_puzzle: Puzzle, real_dictionary: Dictionary) -> frozenset[str]:
+    """Solve the generated puzzle once for integration tests.
+
+    Args:
+        generated_puzzle: The generated puzzle fixture.
+        real_dictionary: The real dictionary fixture.
+
+    Returns:
+        Every word the solver finds in the generated puzzle's tiles.
+    """
+    return frozenset(find_all_valid_words(generated_puzzle.tiles, real_dictionary))
@@ -1,8 +1,10 @@
 """Tests for the Dictionary class."""
 
+import pickle  # noqa: S403 - trusted data only
+
 import pytest
 
-from app.game.dictionary import Dictionary, TrieNode
+from app.game.dictionary import Dictionary, FlatDictionary, FlatTrie, TrieNode
 
 
 class TestTrieNode:
@@ -94,6 +96,104 @@ class TestDictionary:
         words = list(sample_dictionary.words_with_prefix("DOG"))
         assert words == []
 
+    def test_entries_by_length(self, sample_dictionary: Dictionary) -> None:
+        """entries() yields words with definitions within the length range."""
+        entries = dict(sample_dictionary.entries(min_length=4, max_length=4))
+        assert entries == {"CART": "A wheeled vehicle"}
+
+
+class TestFlatDictionary:
+    """Tests for FlatTrie-backed Dictionary."""
+
+    @pytest.fixture
+    def flat_dictionary(self) -> FlatDictionary:
+        """Create a small flat dictionary for testing.
+
+        Returns:
+            A FlatDictionary instance with sample words.
+        """
+        trie = FlatTrie()
+        trie.add_word("cat", "A small feline")
+        trie.add_word("car", "A vehicle")
+        trie.add_word("cart", "A wheeled vehicle")
+        trie.add_word("dog")
+        return FlatDictionary(trie)
+
+    def test_contains(self, flat_dictionary: FlatDictionary) -> None:
+        """contains() matches whole words only."""
+        assert flat_dictionary.contains("Cat") is True
+        assert flat_dictionary.contains("CA") is False
+        assert flat_dictionary.contains("CATS") is False
+        assert flat_dictionary.contains("C4T") is False
+
+    def test_contains_prefix(self, flat_dictionary: FlatDictionary) -> None:
+        """contains_prefix() follows partial paths."""
+        assert flat_dictionary.contains_prefix("CA") is True
+        assert flat_dictionary.contains_prefix("") is True
+        assert flat_dictionary.contains_prefix("XY") is False
+
+    def test_get_definition(self, flat_dictionary: FlatDictionary) -> None:
+        """get_definition() returns stored definitions."""
+        assert flat_dictionary.get_definition("CART") == "A wheeled vehicle"
+        assert flat_dictionary.get_definition("DOG") is None
+        assert flat_dictionary.get_definition("CA") is None
+
+    def test_words_with_prefix_sorted(self, flat_dictionary: FlatDictionary) -> None:
+        """words_with_prefix() yields words in alphabetical order."""
+        assert list(flat_dictionary.words_with_prefix("C")) == ["CAR", "CART", "CAT"]
+
+    def test_entries_by_length(self, flat_dictionary: FlatDictionary) -> None:
+        """entries() yields words with definitions in order, within the length range."""
+        assert list(flat_dictionary.entries(max_length=3)) == [
+            ("CAR", "A vehicle"),
+            ("CAT", "A small feline"),
+            ("DOG", None),
+        ]
+        assert list(flat_dictionary.entries(min_length=4)) == [("CART", "A wheeled vehicle")]
+
+    def test_len(self, flat_dictionary: FlatDictionary) -> None:
+        """len() counts words, not nodes."""
+        assert len(flat_dictionary) == 4
+
+    def test_add_word_rejects_non_letters(self) -> None:
+        """add_word() only accepts A-Z."""
+        with pytest.raises(ValueError, match="only letters"):
+            FlatTrie().add_word("WORD1")
+
+    def test_definitions_are_interned(self) -> None:
+        """Words with the same definition share one pool entry."""
+        trie = FlatTrie()
+        trie.add_word("RUN", "Move fast")
+        trie.add_word("RUNS", "Move fast")
+        trie.add_word("RAN")
+        assert trie.definition_pool == ["", "Move fast"]
+        assert trie.definition(trie.find("RUNS")) == "Move fast"
+        assert trie.definition(trie.find("RAN")) is None
+
+    def test_minimized_merges_shared_suffixes(self) -> None:
+        """minimized() shares identical subtrees without changing lookups."""
+        trie = FlatTrie()
+        for word in ("BAKING", "BOXING", "FAKING", "FAKE"):
+            trie.add_word(word)
+        trie.add_word("BAKE", "To cook")
+        minimized = trie.minimized()
+
+        assert minimized.node_count < trie.node_count
+        original, merged = FlatDictionary(trie), FlatDictionary(minimized)
+        assert list(merged.words_with_prefix("")) == list(original.words_with_prefix(""))
+        assert merged.get_definition("BAKE") == "To cook"
+        assert merged.get_definition("FAKE") is None
+        assert merged.contains("FAKIN") is False
+
+    def test_add_word_any_order(self) -> None:
+        """Resuming from the previous word's path works for unsorted input."""
+        trie = FlatTrie()
+        for word in ("CART", "CAT", "BAT", "CA", "CARTS", "BATS"):
+            trie.add_word(word)
+        dictionary = FlatDictionary(trie)
+        assert list(dictionary.words_with_prefix("")) == ["BAT", "BATS", "CA", "CART", "CARTS", "CAT"]
+        assert trie.node_count == 11
+
 
 class TestDictionaryLoad:
     """Tests for dictionary loading."""
@@ -102,3 +202,39 @@ class TestDictionaryLoad:
         """load() raises FileNotFoundError for missing file."""
         with pytest.raises(FileNotFoundError):
             Dictionary.load(tmp_path / "nonexistent.bin")
+
+    def test_load_flat_trie_file(self, tmp_path) -> None:
+        """load() memory-maps a file written by FlatTrie.write()."""
+        trie = FlatTrie()
+        trie.add_word("CAT", "A small feline")
+        trie.add_word("CART", "Un chariot \u00e0 bras")
+        trie.add_word("CAR")
+        path = tmp_path / "dictionary.bin"
+        trie.write(path)
+
+        dictionary = Dictionary.load(path)
+        assert isinstance(dictionary, FlatDictionary)
+        assert dictionary.get_definition("CAT") == "A small feline"
+        assert dictionary.get_definition("CART") == "Un chariot \u00e0 bras"
+        assert dictionary.get_definition("CAR") is None
+        assert list(dictionary.words_with_prefix("CA")) == ["CAR", "CART", "CAT"]
+        assert len(dictionary) == 3
+
+    def test_len_of_minimized_file(self, tmp_path) -> None:
+        """len() counts words, not shared nodes, after minimizing and reopening."""
+        trie = FlatTrie()
+        for word in ("BAKE", "BAKING", "BOXING", "FAKE", "FAKING"):
+            trie.add_word(word)
+        path = tmp_path / "dictionary.bin"
+        trie.minimized().write(path)
+
+        assert len(Dictionary.load(path)) == 5
+
+    def test_load_legacy_trie_node(self, tmp_path) -> None:
+        """load() still accepts a pickled TrieNode graph."""
+        root = TrieNode()
+        root.children["A"] = TrieNode(is_word=True)
+        path = tmp_path / "dictionary.bin"
+        path.write_bytes(pickle.dumps(root))
+
+        assert Dictionary.load(path).contains("A") is True
@@ -10,6 +10,17 @@ from app.game.generator import (
     generate_puzzle,
     iterate_quartile_candidates,
 )
+from tests.utils.trie import build_trie
+
+# Read-only dictionaries shared by every test that asks for them
+QUARTILE_DICTIONARY = build_trie(
+    {
+        "SHORT": "Not long enough",
+        "BEAUTIFUL": "Pleasing to the senses",
+        "CHALLENGING": "Difficult",
+    }
+)
+ITER_DICTIONARY = build_trie({"ABSOLUTELY": "Without exception"})
 
 
 class TestDecomposeSingleWord:
@@ -64,13 +75,21 @@ class TestDecomposeWordsToTiles:
 
     def test_decompose_five_words(self) -> None:
         """5 words decompose into exactly 20 tiles."""
-        words = ["QUARTILES", "TESTWORDS", "PLAYGAMES", "JUMPING", "RUNNING"]
+        words = ["QUARTILES", "TESTWORDS", "PLAYGAMES", "JUMPROPES", "RUNAROUND"]
         tiles = _decompose_words_to_tiles(words)
-        # This might fail due to backtracking complexity
-        # We just verify the function runs without error
-        # and returns None if decomposition fails
-        if tiles is not None:
-            assert len(tiles) == 20
+        assert tiles is not None
+        assert len(tiles) == 20
+        assert "".join(t.letters for t in tiles) == "".join(words)
+        assert len({t.letters for t in tiles}) == 20
+
+    def test_decompose_backtracks_across_words(self) -> None:
+        """Revisits an earlier word's split when a later word has no other option."""
+        # ABJKLMNO can only split as AB-JK-LM-NO, so ABCDEFGHI must avoid AB
+        words = ["ABCDEFGHI", "ABJKLMNO", "PQRSTUVW", "STUVWXYZ", "ZYXWVUTS"]
+        tiles = _decompose_words_to_tiles(words)
+        assert tiles is not None
+        assert [t.letters for t in tiles[:4]] != ["AB", "CD", "EF", "GHI"]
+        assert "".join(t.letters for t in tiles) == "".join(words)
 
     def test_decompose_fails_on_duplicate_tiles(self) -> None:
         """Returns None if duplicate tiles would be created."""
@@ -101,62 +120,7 @@ class TestGetQuartileWords:
         Returns:
             A Dictionary with words of varying lengths.
         """
-        root = TrieNode()
-
-        # Add SHORT (6 letters - too short)
-        short_node = TrieNode(is_word=True, definition="Not long enough")
-        root.children["S"] = TrieNode()
-        root.children["S"].children["H"] = TrieNode()
-        root.children["S"].children["H"].children["O"] = TrieNode()
-        root.children["S"].children["H"].children["O"].children["R"] = TrieNode()
-        root.children["S"].children["H"].children["O"].children["R"].children["T"] = short_node
-
-        # Add BEAUTIFUL (9 letters - has definition)
-        b_node = TrieNode()
-        root.children["B"] = b_node
-        # Build B-E-A-U-T-I-F-U-L
-        e_node = TrieNode()
-        a_node = TrieNode()
-        u_node = TrieNode()
-        t_node = TrieNode()
-        i_node = TrieNode()
-        f_node = TrieNode()
-        u2_node = TrieNode()
-        l_node = TrieNode(is_word=True, definition="Pleasing to the senses")
-        b_node.children["E"] = e_node
-        e_node.children["A"] = a_node
-        a_node.children["U"] = u_node
-        u_node.children["T"] = t_node
-        t_node.children["I"] = i_node
-        i_node.children["F"] = f_node
-        f_node.children["U"] = u2_node
-        u2_node.children["L"] = l_node
-
-        # Add CHALLENGING (11 letters - has definition)
-        c_node = TrieNode()
-        root.children["C"] = c_node
-        # Build C-H-A-L-L-E-N-G-I-N-G
-        h_node = TrieNode()
-        l_node = TrieNode()
-        l2_node = TrieNode()
-        e2_node = TrieNode()
-        n_node = TrieNode()
-        g_node = TrieNode()
-        i_node = TrieNode()
-        n2_node = TrieNode()
-        g2_node = TrieNode(is_word=True, definition="Difficult")
-        c_node.children["H"] = h_node
-        h_node.children["A"] = a_node
-        a_node.children["L"] = l_node
-        l_node.children["L"] = l2_node
-        l2_node.children["E"] = e2_node
-        e2_node.children["N"] = n_node
-        n_node.children["G"] = g_node
-        g_node.children["I"] = i_node
-        i_node.children["N"] = n2_node
-        n2_node.children["G"] = g2_node
-
-        return Dictionary(root)
+        return QUARTILE_DICTIONARY
 
     def test_filters_by_length(self, quartile_dictionary: Dictionary) -> None:
         """Only includes words 8-16 letters."""
@@ -186,32 +150,7 @@ class TestIterateQuartileCandidates:
         Returns:
             A Dictionary with a word in valid quartile range.
         """
-        root = TrieNode()
-
-        # Add a word in valid range
-        a_node = TrieNode()
-        root.children["A"] = a_node
-        # Build ABSOLUTELY (10 letters, with definition)
-        b_node = TrieNode()
-        s_node = TrieNode()
-        o_node = TrieNode()
-        l_node = TrieNode()
-        u_node = TrieNode()
-        t_node = TrieNode()
-        e_node = TrieNode()
-        l2_node = TrieNode()
-        y_node = TrieNode(is_word=True, definition="Without exception")
-        a_node.children["B"] = b_node
-        b_node.children["S"] = s_node
-        s_node.children["O"] = o_node
-        o_node.children["L"] = l_node
-        l_node.children["U"] = u_node
-        u_node.children["T"] = t_node
-        t_node.children["E"] = e_node
-        e_node.children["L"] = l2_node
-        l2_node.children["Y"] = y_node
-
-        return Dictionary(root)
+        return ITER_DICTIONARY
 
     def test_yields_valid_words(self, iter_dictionary: Dictionary) -> None:
         """Yields words in valid length range."""
@@ -4,20 +4,17 @@ import pytest
 
 from app.game.dictionary import Dictionary
 from app.game.generator import generate_puzzle
-from app.game.solver import (
-    find_all_valid_words,
-    is_quartile_word,
-)
+from app.game.solver import is_quartile_word
 from app.game.types import GameState, Puzzle
 
 
 class TestDictionaryLoad:
     """Tests for loading the real dictionary."""
 
-    def test_load_real_dictionary(self) -> None:
+    def test_load_real_dictionary(self, real_dictionary: Dictionary) -> None:
         """Real dictionary loads successfully."""
-        dictionary = Dictionary.load()
-        assert len(dictionary) > 0
+        # real_dictionary is Dictionary.load(), shared across the session
+        assert len(real_dictionary) > 0
 
     def test_dictionary_contains_common_words(self, real_dictionary: Dictionary) -> None:
         """Dictionary contains common English words."""
@@ -83,18 +80,13 @@ class TestPuzzleGeneration:
             assert quartile in puzzle.valid_words
 
     @pytest.mark.slow
-    def test_excluded_quartiles_respected(self, generated_puzzle: Puzzle, real_dictionary: Dictionary) -> None:
-        """Excluded quartiles are not used in new puzzles.
-
-        Note: This test cannot use the shared generated_puzzle fixture because
-        it needs to generate TWO different puzzles with different exclusions.
-        """
+    def test_excluded_quartiles_respected(self, generated_puzzle: Puzzle, next_puzzle: Puzzle) -> None:
+        """Excluded quartiles are not used in new puzzles."""
         puzzle1 = generated_puzzle
         assert puzzle1 is not None
 
-        # Exclude the quartiles from the first puzzle
-        excluded = set(puzzle1.quartile_words)
-        puzzle2 = generate_puzzle(real_dictionary, excluded_quartiles=excluded)
+        # next_puzzle was generated excluding the first puzzle's quartiles
+        puzzle2 = next_puzzle
         assert puzzle2 is not None
 
         # Second puzzle should not use any of the first puzzle's quartiles
@@ -162,25 +154,23 @@ class TestGameState:
 class TestWordFinding:
     """Integration tests for word finding."""
 
-    def test_find_words_from_generated_puzzle(self, generated_puzzle: Puzzle, real_dictionary: Dictionary) -> None:
+    def test_find_words_from_generated_puzzle(self, generated_puzzle: Puzzle, solved_words: frozenset[str]) -> None:
         """Can find valid words from a generated puzzle."""
         puzzle = generated_puzzle
 
         assert puzzle is not None
         # The puzzle already has valid_words pre-computed
-        # Let's verify by running the solver ourselves
-        found_words = find_all_valid_words(puzzle.tiles, real_dictionary)
+        # Let's verify against the solver's own results
 
         # Should find all the quartile words
         for quartile in puzzle.quartile_words:
-            assert quartile in found_words
+            assert quartile in solved_words
 
-    def test_solver_matches_puzzle_valid_words(self, generated_puzzle: Puzzle, real_dictionary: Dictionary) -> None:
+    def test_solver_matches_puzzle_valid_words(self, generated_puzzle: Puzzle, solved_words: frozenset[str]) -> None:
         """Solver results match puzzle's valid_words set."""
         puzzle = generated_puzzle
 
         assert puzzle is not None
-        found_words = find_all_valid_words(puzzle.tiles, real_dictionary)
 
         # The puzzle's valid_words should match what we find
-        assert found_words == puzzle.valid_words
+        assert solved_words == puzzle.valid_words
@@ -7,6 +7,7 @@ from app.game.solver import (
     calculate_hint_penalty,
     calculate_total_points,
     find_all_valid_words,
+    find_word_tile_counts,
     get_tile_count,
     get_unfound_quartile_hint,
     is_quartile_word,
@@ -145,6 +146,13 @@ class TestFindAllValidWords:
         words = find_all_valid_words(tiles, solver_dictionary)
         assert "TEST" in words
 
+    def test_tile_counts_are_minimal(self, solver_dictionary: Dictionary) -> None:
+        """Records the smallest number of tiles that forms each word."""
+        tiles = (Tile(0, "TE"), Tile(1, "ST"), Tile(2, "TEST"))
+        counts = find_word_tile_counts(tiles, solver_dictionary)
+        assert counts == {"TEST": 1}
+        assert counts["TEST"] == get_tile_count("TEST", tiles)
+
 
 class TestCalculateTotalPoints:
     """Tests for calculate_total_points function."""
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from app.game.dictionary import NO_CHILD, Dictionary, FlatDictionary, FlatTrie
+from scripts.build_dictionary import DictionaryBuilder
+
+
+def test_merge_round_trip_keeps_words_and_count(tmp_path: Path) -> None:
+    """Merged builders serialize to a file that reports every word."""
+    parts = []
+    for words in (("BAKE", "BAKING"), ("FAKE", "FAKING"), ("MAKE",)):
+        builder = DictionaryBuilder()
+        for word in words:
+            builder.add_word(word, "To cook" if word == "BAKE" else None)
+        parts.append(builder)
+
+    merged = DictionaryBuilder.merge(parts)
+    assert merged.trie.word_count == merged.word_count == 5
+
+    path = tmp_path / "dictionary.bin"
+    merged.serialize(path)
+    dictionary = Dictionary.load(path)
+
+    assert isinstance(dictionary, FlatDictionary)
+    assert len(dictionary) == 5
+    trie = FlatTrie.open(path)
+    assert trie.word_count == 5
+    assert trie.find("FAKING") != NO_CHILD
+    assert trie.is_word[trie.find("MAKE")]
+    assert trie.find("TAKE") == NO_CHILD
+    assert dictionary.get_definition("BAKE") == "To cook"
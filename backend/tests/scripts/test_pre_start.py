@@ -0,0 +1,65 @@
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel import select
+
+from app import backend_pre_start, tests_pre_start
+
+_SELECT_ONE = select(1)
+
+
+@pytest.fixture(params=[backend_pre_start, tests_pre_start], ids=lambda module: module.__name__)
+def pre_start(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub the engine, session, select and logger used by a pre-start script.
+
+    Returns:
+        The script module, the session mock, the select statement it is given and the info log mock.
+    """
+    module: ModuleType = request.param
+    session_mock = MagicMock()
+    session_mock.__enter__.return_value = session_mock
+    info_mock = MagicMock()
+
+    monkeypatch.setattr(module, "engine", MagicMock())
+    monkeypatch.setattr(module, "Session", MagicMock(return_value=session_mock))
+    monkeypatch.setattr(module, "select", MagicMock(return_value=_SELECT_ONE))
+    monkeypatch.setattr(module.logger, "info", info_mock)
+    monkeypatch.setattr(module.logger, "error", MagicMock())
+    monkeypatch.setattr(module.logger, "warn", MagicMock())
+    return SimpleNamespace(module=module, session=session_mock, select=_SELECT_ONE, info=info_mock)
+
+
+def test_init_successful_connection(pre_start: SimpleNamespace) -> None:
+    try:
+        pre_start.module.init(MagicMock())
+        connection_successful = True
+    except Exception:
+        connection_successful = False
+
+    assert connection_successful, "The database connection should be successful and not raise an exception."
+
+    pre_start.session.exec.assert_called_once_with(pre_start.select)
+
+
+def test_main_logs_initialization(pre_start: SimpleNamespace) -> None:
+    """Test main() logs startup."""
+    pre_start.module.main()
+
+    # Verify initialization logging
+    assert pre_start.info.call_count == 2
+    init_call = pre_start.info.call_args_list[0]
+    finish_call = pre_start.info.call_args_list[1]
+
+    assert init_call[0][0] == "Initializing service"
+    assert finish_call[0][0] == "Service finished initializing"
+
+
+def test_main_module_execution(pre_start: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the if __name__ == '__main__' block."""
+    monkeypatch.setattr(pre_start.module, "__name__", "__main__")
+
+    # The module should execute main() when __name__ == "__main__"
+    # We can't directly test this without actually running as __main__,
+    # but we can verify main() is callable and works
+    assert callable(pre_start.module.main)
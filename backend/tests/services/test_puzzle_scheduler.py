@@ -0,0 +1,114 @@
+"""Tests for the puzzle scheduling service."""
+
+from collections.abc import Generator
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import Engine, delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.game.types import Puzzle as GamePuzzle
+from app.game.types import Tile
+from app.models import Puzzle, QuartileCooldown
+from app.services import puzzle_scheduler
+from app.services.puzzle_scheduler import _insert_puzzle, generate_upcoming_puzzles
+
+TEST_DATE = date(2024, 2, 1)
+TILES_JSON = '[{"id": 0, "letters": "CH"}]'
+UPCOMING_WORDS = ("CHUBBY", "PENGUIN", "UNICORN")
+FAILING_WORD = "PENGUIN"
+
+
+def _puzzle(target_date: date, quartile_word: str) -> Puzzle:
+    """Build a minimal puzzle row for ``target_date``.
+
+    Args:
+        target_date: The puzzle's date.
+        quartile_word: The puzzle's only quartile word.
+
+    Returns:
+        An unsaved Puzzle.
+    """
+    return Puzzle(
+        date=target_date,
+        tiles_json=TILES_JSON,
+        quartile_words_json=f'["{quartile_word}"]',
+        valid_words_json=f'["{quartile_word}"]',
+        total_available_points=8,
+    )
+
+
+def test_insert_puzzle_returns_existing_row_for_taken_date(session: Session) -> None:
+    """A puzzle for an existing date yields that row and records no cooldowns."""
+    existing = _puzzle(TEST_DATE, "CHUBBY")
+    session.add(existing)
+    session.commit()
+
+    stored = _insert_puzzle(session, _puzzle(TEST_DATE, "PENGUIN"), ["PENGUIN"])
+
+    assert stored.id == existing.id
+    assert stored.quartile_words_json == '["CHUBBY"]'
+    assert session.get(QuartileCooldown, "PENGUIN") is None
+
+
+def _delete_upcoming(engine: Engine, dates: list[date]) -> None:
+    """Delete committed puzzles on ``dates`` and the UPCOMING_WORDS cooldowns.
+
+    Args:
+        engine: The database engine.
+        dates: The puzzle dates to clear.
+    """
+    with Session(engine) as db:
+        db.execute(delete(Puzzle).where(Puzzle.date.in_(dates)))  # type: ignore[attr-defined]
+        db.execute(delete(QuartileCooldown).where(QuartileCooldown.word.in_(UPCOMING_WORDS)))  # type: ignore[attr-defined]
+        db.commit()
+
+
+@pytest.fixture
+def upcoming_dates(engine: Engine) -> Generator[list[date]]:
+    """Clear the next few days before and after a test that commits them.
+
+    Args:
+        engine: The database engine fixture.
+
+    Yields:
+        The dates generate_upcoming_puzzles(len(UPCOMING_WORDS)) covers.
+    """
+    today = datetime.now(UTC).date()
+    dates = [today + timedelta(days=offset) for offset in range(len(UPCOMING_WORDS))]
+    _delete_upcoming(engine, dates)
+    yield dates
+    _delete_upcoming(engine, dates)
+
+
+def test_generate_upcoming_puzzles_keeps_other_dates_on_failure(engine: Engine, upcoming_dates: list[date]) -> None:
+    """A date that fails inside its savepoint doesn't undo the other dates."""
+    update_quartile_cooldowns = puzzle_scheduler.update_quartile_cooldowns
+
+    def fail_for_one_word(db: Session, quartile_words: list[str], *, commit: bool = True) -> None:
+        # Fail after the puzzle row is inserted, so the savepoint has to undo it
+        if FAILING_WORD in quartile_words:
+            statement = "INSERT INTO quartile_cooldown"
+            raise IntegrityError(statement, {}, Exception(FAILING_WORD))
+        update_quartile_cooldowns(db, quartile_words, commit=commit)
+
+    game_puzzles = [
+        GamePuzzle(
+            tiles=(Tile(id=0, letters="CH"),), quartile_words=(word,), valid_words=frozenset({word}), total_points=8
+        )
+        for word in UPCOMING_WORDS
+    ]
+    with (
+        patch.object(puzzle_scheduler, "get_dictionary"),
+        patch.object(puzzle_scheduler, "generate_puzzle", side_effect=game_puzzles),
+        patch.object(puzzle_scheduler, "update_quartile_cooldowns", side_effect=fail_for_one_word),
+    ):
+        generate_upcoming_puzzles(days_ahead=len(UPCOMING_WORDS))
+
+    with Session(engine) as db:
+        stored = db.exec(select(Puzzle).where(Puzzle.date.in_(upcoming_dates))).all()  # type: ignore[attr-defined]
+        cooldowns = db.exec(select(QuartileCooldown.word).where(QuartileCooldown.word.in_(UPCOMING_WORDS))).all()  # type: ignore[attr-defined]
+    assert sorted(puzzle.date for puzzle in stored) == [upcoming_dates[0], upcoming_dates[2]]
+    assert sorted(cooldowns) == ["CHUBBY", "UNICORN"]
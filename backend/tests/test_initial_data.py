@@ -4,28 +4,28 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from app import initial_data
+from app.initial_data import init, logger, main
+
 
 def test_init_creates_initial_data(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test init() calls init_db."""
-    from app.initial_data import init
-
     mock_init_db = MagicMock()
-    monkeypatch.setattr("app.initial_data.init_db", mock_init_db)
+    monkeypatch.setattr(initial_data, "init_db", mock_init_db)
 
     init()
 
     mock_init_db.assert_called_once()
 
 
-def test_main_logs_initialization(monkeypatch: pytest.MonkeyPatch, caplog) -> None:
+def test_main_logs_initialization(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test main() logs properly."""
-    from app.initial_data import main
-
     mock_init = MagicMock()
-    monkeypatch.setattr("app.initial_data.init", mock_init)
+    mock_info = MagicMock()
+    monkeypatch.setattr(initial_data, "init", mock_init)
+    monkeypatch.setattr(logger, "info", mock_info)
 
-    with caplog.at_level("INFO"):
-        main()
+    main()
 
     mock_init.assert_called_once()
-    assert "Creating initial data" in caplog.text or "Initial data created" in caplog.text
+    assert [call.args[0] for call in mock_info.call_args_list] == ["Creating initial data", "Initial data created"]
@@ -2,13 +2,13 @@
 
 from unittest.mock import MagicMock
 
+from fastapi.routing import APIRoute
 
-def test_custom_generate_unique_id() -> None:
-    """Test custom route ID generation."""
-    from fastapi.routing import APIRoute
+from app.main import app, custom_generate_unique_id
 
-    from app.main import custom_generate_unique_id
 
+def test_custom_generate_unique_id() -> None:
+    """Test custom route ID generation."""
     # Create a mock route with tags
     mock_route = MagicMock(spec=APIRoute)
     mock_route.tags = ["users"]
@@ -20,8 +20,6 @@ def test_custom_generate_unique_id() -> None:
 
 def test_app_includes_api_router() -> None:
     """Test app includes API router."""
-    import app.main
-
     # Check that routes are registered
-    routes = [getattr(route, "path", "") for route in app.main.app.routes]
+    routes = [getattr(route, "path", "") for route in app.routes]
     assert any("/api" in route for route in routes)
@@ -15,7 +15,6 @@ from app.models import (
     LeaderboardEntrySchema,
     LeaderboardResponse,
     Player,
-    PreviousResultSchema,
     Puzzle,
     PuzzleResponse,
     QuartileCooldown,
@@ -23,6 +22,37 @@ from app.models import (
     WordValidationResponse,
 )
 
+# Read the clock once so date assertions can't straddle midnight
+NOW = datetime.now(UTC)
+TODAY = NOW.date()
+
+# Fixed, distinct identifiers; the tests only check they are stored as given
+PUZZLE_ID = uuid.UUID(int=1)
+PLAYER_ID = uuid.UUID(int=2)
+OTHER_PLAYER_ID = uuid.UUID(int=3)
+SESSION_ID = uuid.UUID(int=4)
+ENTRY_ID = uuid.UUID(int=5)
+USER_ID = uuid.UUID(int=6)
+
+SAMPLE_TILES = ({"id": 1, "letters": "AB"}, {"id": 2, "letters": "CD"})
+QUARTILE_WORDS = ("WORD1", "WORD2", "WORD3", "WORD4", "WORD5")
+VALID_WORDS = (*QUARTILE_WORDS, "EXTRA")
+
+# Serialized once at import; the Puzzle tests reuse the same payloads
+SAMPLE_TILES_JSON = json.dumps(SAMPLE_TILES)
+QUARTILE_WORDS_JSON = json.dumps(QUARTILE_WORDS)
+VALID_WORDS_JSON = json.dumps(VALID_WORDS)
+
+# A first-time player's game start; tests override fields by unpacking it
+GAME_START_PAYLOAD = {
+    "session_id": SESSION_ID,
+    "player_id": PLAYER_ID,
+    "display_name": "ChubbyPenguin",
+    "tiles": [{"id": 1, "letters": "AB"}],
+    "already_played": False,
+    "previous_result": None,
+}
+
 
 class TestTileSchema:
     """Tests for TileSchema Pydantic model."""
@@ -47,7 +77,7 @@ class TestPlayer:
     def test_create_player(self) -> None:
         """Test creating a player."""
         player = Player(
-            id=uuid.uuid4(),
+            id=PLAYER_ID,
             display_name="ChubbyPenguin",
             device_fingerprint="abc123",
             user_id=None,
@@ -58,13 +88,12 @@ class TestPlayer:
 
     def test_player_with_user_id(self) -> None:
         """Test creating a player with a user_id."""
-        user_id = uuid.uuid4()
         player = Player(
-            id=uuid.uuid4(),
+            id=PLAYER_ID,
             display_name="TestUser",
-            user_id=user_id,
+            user_id=USER_ID,
         )
-        assert player.user_id == user_id
+        assert player.user_id == USER_ID
 
 
 class TestPuzzle:
@@ -72,33 +101,28 @@ class TestPuzzle:
 
     def test_create_puzzle(self) -> None:
         """Test creating a puzzle."""
-        tiles = [{"id": 1, "letters": "AB"}, {"id": 2, "letters": "CD"}]
-        quartile_words = ["WORD1", "WORD2", "WORD3", "WORD4", "WORD5"]
-        valid_words = ["WORD1", "WORD2", "WORD3", "WORD4", "WORD5", "EXTRA"]
-
         puzzle = Puzzle(
-            id=uuid.uuid4(),
-            date=datetime.now(UTC).date(),
-            tiles_json=json.dumps(tiles),
-            quartile_words_json=json.dumps(quartile_words),
-            valid_words_json=json.dumps(valid_words),
+            id=PUZZLE_ID,
+            date=TODAY,
+            tiles_json=SAMPLE_TILES_JSON,
+            quartile_words_json=QUARTILE_WORDS_JSON,
+            valid_words_json=VALID_WORDS_JSON,
             total_available_points=100,
         )
-        assert puzzle.date == datetime.now(UTC).date()
+        assert puzzle.date == TODAY
         assert puzzle.total_available_points == 100
 
     def test_puzzle_json_fields(self) -> None:
         """Test puzzle JSON serialization."""
-        tiles = [{"id": 1, "letters": "AB"}]
         puzzle = Puzzle(
-            id=uuid.uuid4(),
-            date=datetime.now(UTC).date(),
-            tiles_json=json.dumps(tiles),
-            quartile_words_json='["WORD"]',
-            valid_words_json='["WORD"]',
+            id=PUZZLE_ID,
+            date=TODAY,
+            tiles_json=SAMPLE_TILES_JSON,
+            quartile_words_json=QUARTILE_WORDS_JSON,
+            valid_words_json=VALID_WORDS_JSON,
             total_available_points=50,
         )
-        assert json.loads(puzzle.tiles_json) == tiles
+        assert json.loads(puzzle.tiles_json) == list(SAMPLE_TILES)
 
 
 class TestGameSession:
@@ -106,32 +130,30 @@ class TestGameSession:
 
     def test_create_game_session(self) -> None:
         """Test creating a game session."""
-        puzzle_id = uuid.uuid4()
-        player_id = uuid.uuid4()
-        start_time = datetime.now(UTC)
+        start_time = NOW
 
         session = GameSession(
-            id=uuid.uuid4(),
-            puzzle_id=puzzle_id,
-            player_id=player_id,
+            id=SESSION_ID,
+            puzzle_id=PUZZLE_ID,
+            player_id=PLAYER_ID,
             start_time=start_time,
             final_score=0,
             hints_used=0,
             hint_penalty_ms=0,
             words_found_json="[]",
         )
-        assert session.puzzle_id == puzzle_id
-        assert session.player_id == player_id
+        assert session.puzzle_id == PUZZLE_ID
+        assert session.player_id == PLAYER_ID
         assert session.final_score == 0
         assert session.hints_used == 0
 
     def test_game_session_with_progress(self) -> None:
         """Test game session with progress."""
         session = GameSession(
-            id=uuid.uuid4(),
-            puzzle_id=uuid.uuid4(),
-            player_id=uuid.uuid4(),
-            start_time=datetime.now(UTC),
+            id=SESSION_ID,
+            puzzle_id=PUZZLE_ID,
+            player_id=PLAYER_ID,
+            start_time=NOW,
             final_score=25,
             hints_used=1,
             hint_penalty_ms=30000,
@@ -143,13 +165,13 @@ class TestGameSession:
 
     def test_game_session_completion(self) -> None:
         """Test completing a game session."""
-        start_time = datetime.now(UTC)
-        completed_at = datetime.now(UTC)
+        start_time = NOW
+        completed_at = NOW
 
         session = GameSession(
-            id=uuid.uuid4(),
-            puzzle_id=uuid.uuid4(),
-            player_id=uuid.uuid4(),
+            id=SESSION_ID,
+            puzzle_id=PUZZLE_ID,
+            player_id=PLAYER_ID,
             start_time=start_time,
             completed_at=completed_at,
             solve_time_ms=60000,
@@ -168,17 +190,15 @@ class TestLeaderboardEntry:
 
     def test_create_leaderboard_entry(self) -> None:
         """Test creating a leaderboard entry."""
-        puzzle_id = uuid.uuid4()
-        player_id = uuid.uuid4()
-
         entry = LeaderboardEntry(
-            id=uuid.uuid4(),
-            puzzle_id=puzzle_id,
-            player_id=player_id,
+            id=ENTRY_ID,
+            puzzle_id=PUZZLE_ID,
+            player_id=PLAYER_ID,
+            display_name="ChubbyPenguin",
             solve_time_ms=45000,
         )
-        assert entry.puzzle_id == puzzle_id
-        assert entry.player_id == player_id
+        assert entry.puzzle_id == PUZZLE_ID
+        assert entry.player_id == PLAYER_ID
         assert entry.solve_time_ms == 45000
 
 
@@ -189,10 +209,10 @@ class TestQuartileCooldown:
         """Test creating a quartile cooldown entry."""
         cooldown = QuartileCooldown(
             word="EXAMPLE",
-            last_used_date=datetime.now(UTC).date(),
+            last_used_date=TODAY,
         )
         assert cooldown.word == "EXAMPLE"
-        assert cooldown.last_used_date == datetime.now(UTC).date()
+        assert cooldown.last_used_date == TODAY
 
 
 class TestPuzzleResponse:
@@ -200,15 +220,14 @@ class TestPuzzleResponse:
 
     def test_puzzle_response(self) -> None:
         """Test creating a puzzle response."""
-        puzzle_id = uuid.uuid4()
         tiles = [TileSchema(id=1, letters="AB"), TileSchema(id=2, letters="CD")]
 
         response = PuzzleResponse(
-            id=puzzle_id,
-            date=datetime.now(UTC).date(),
+            id=PUZZLE_ID,
+            date=TODAY,
             tiles=tiles,
         )
-        assert response.id == puzzle_id
+        assert response.id == PUZZLE_ID
         assert len(response.tiles) == 2
         assert response.tiles[0].letters == "AB"
 
@@ -218,41 +237,20 @@ class TestGameStartResponse:
 
     def test_game_start_response_new_player(self) -> None:
         """Test game start response for new player."""
-        session_id = uuid.uuid4()
-        player_id = uuid.uuid4()
-        tiles = [TileSchema(id=1, letters="AB")]
-
-        response = GameStartResponse(
-            session_id=session_id,
-            player_id=player_id,
-            display_name="ChubbyPenguin",
-            tiles=tiles,
-            already_played=False,
-            previous_result=None,
-        )
-        assert response.session_id == session_id
+        response = GameStartResponse.model_validate(GAME_START_PAYLOAD)
+        assert response.session_id == SESSION_ID
         assert response.display_name == "ChubbyPenguin"
         assert response.already_played is False
         assert response.previous_result is None
 
     def test_game_start_response_previous_play(self) -> None:
         """Test game start response with previous result."""
-        session_id = uuid.uuid4()
-        player_id = uuid.uuid4()
-        tiles = [TileSchema(id=1, letters="AB")]
-        previous_result = PreviousResultSchema(
-            final_score=75,
-            solve_time_ms=90000,
-            leaderboard_rank=5,
-        )
-
-        response = GameStartResponse(
-            session_id=session_id,
-            player_id=player_id,
-            display_name="ChubbyPenguin",
-            tiles=tiles,
-            already_played=True,
-            previous_result=previous_result,
+        response = GameStartResponse.model_validate(
+            {
+                **GAME_START_PAYLOAD,
+                "already_played": True,
+                "previous_result": {"final_score": 75, "solve_time_ms": 90000, "leaderboard_rank": 5},
+            }
         )
         assert response.already_played is True
         assert response.previous_result is not None
@@ -263,48 +261,43 @@ class TestGameStartResponse:
 class TestWordValidationResponse:
     """Tests for WordValidationResponse Pydantic schema."""
 
-    def test_valid_word_response(self) -> None:
-        """Test response for valid word."""
-        response = WordValidationResponse(
-            is_valid=True,
-            points=4,
-            reason=None,
-            is_quartile=False,
-            current_score=25,
-            is_solved=False,
-        )
-        assert response.is_valid is True
-        assert response.points == 4
-        assert response.is_quartile is False
-
-    def test_invalid_word_response(self) -> None:
-        """Test response for invalid word."""
-        response = WordValidationResponse(
-            is_valid=False,
-            points=None,
-            reason="Word not found in puzzle",
-            is_quartile=False,
-            current_score=25,
-            is_solved=False,
-        )
-        assert response.is_valid is False
-        assert response.points is None
-        assert response.reason == "Word not found in puzzle"
-
-    def test_quartile_word_response(self) -> None:
-        """Test response for quartile word."""
-        response = WordValidationResponse(
-            is_valid=True,
-            points=10,
-            reason=None,
-            is_quartile=True,
-            current_score=95,
-            is_solved=True,
-        )
-        assert response.is_valid is True
-        assert response.points == 10
-        assert response.is_quartile is True
-        assert response.is_solved is True
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            # Valid word
+            {
+                "is_valid": True,
+                "points": 4,
+                "reason": None,
+                "is_quartile": False,
+                "current_score": 25,
+                "is_solved": False,
+            },
+            # Invalid word
+            {
+                "is_valid": False,
+                "points": None,
+                "reason": "Word not found in puzzle",
+                "is_quartile": False,
+                "current_score": 25,
+                "is_solved": False,
+            },
+            # Quartile word that solves the puzzle
+            {
+                "is_valid": True,
+                "points": 10,
+                "reason": None,
+                "is_quartile": True,
+                "current_score": 95,
+                "is_solved": True,
+            },
+        ],
+        ids=["valid", "invalid", "quartile"],
+    )
+    def test_word_response(self, fields: dict[str, object]) -> None:
+        """Test responses for valid, invalid and quartile words keep every field."""
+        response = WordValidationResponse.model_validate(fields)
+        assert response.model_dump() == fields
 
 
 class TestGameSubmitResponse:
@@ -345,23 +338,23 @@ class TestLeaderboardResponse:
         entries = [
             LeaderboardEntrySchema(
                 rank=1,
-                player_id=uuid.uuid4(),
+                player_id=PLAYER_ID,
                 display_name="FastPlayer",
                 solve_time_ms=30000,
             ),
             LeaderboardEntrySchema(
                 rank=2,
-                player_id=uuid.uuid4(),
+                player_id=OTHER_PLAYER_ID,
                 display_name="SlowPlayer",
                 solve_time_ms=90000,
             ),
         ]
 
         response = LeaderboardResponse(
-            date=datetime.now(UTC).date(),
+            date=TODAY,
             entries=entries,
         )
-        assert response.date == datetime.now(UTC).date()
+        assert response.date == TODAY
         assert len(response.entries) == 2
         assert response.entries[0].rank == 1
         assert response.entries[0].display_name == "FastPlayer"
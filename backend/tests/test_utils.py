@@ -1,38 +1,73 @@
 """Tests for utility functions."""
 
+import jwt
+import pytest
 
-def test_verify_password_reset_token_valid() -> None:
-    """Test valid token returns email."""
-    from app.utils import generate_password_reset_token, verify_password_reset_token
+from app.core.config import settings
+from app.utils import (
+    generate_new_account_email,
+    generate_password_reset_token,
+    generate_reset_password_email,
+    generate_test_email,
+    verify_password_reset_token,
+)
+
+RESET_EMAIL = "test@example.com"
+
+
+@pytest.fixture(scope="module")
+def reset_token() -> str:
+    """Generate one password reset token for the module's token tests.
+
+    Returns:
+        A password reset token for RESET_EMAIL.
+    """
+    return generate_password_reset_token(email=RESET_EMAIL)
 
-    email = "test@example.com"
-    token = generate_password_reset_token(email=email)
-    result = verify_password_reset_token(token)
 
-    assert result == email
+def test_verify_password_reset_token_valid(reset_token: str) -> None:
+    """Test valid token returns email."""
+    result = verify_password_reset_token(reset_token)
+
+    assert result == RESET_EMAIL
 
 
 def test_verify_password_reset_token_invalid() -> None:
     """Test invalid token returns None."""
-    from app.utils import verify_password_reset_token
-
     result = verify_password_reset_token("invalid-token")
     assert result is None
 
 
-def test_generate_password_reset_token() -> None:
+def test_generate_password_reset_token(reset_token: str) -> None:
     """Test token generation includes email and expiration."""
-    import jwt
+    # Verify token can be decoded with the actual settings
+    decoded = jwt.decode(reset_token, settings.SECRET_KEY, algorithms=["HS256"])
+    assert decoded["sub"] == RESET_EMAIL
+    assert "exp" in decoded
+    assert "nbf" in decoded
 
-    from app.utils import generate_password_reset_token
 
-    email = "test@example.com"
-    token = generate_password_reset_token(email=email)
+def test_generate_reset_password_email() -> None:
+    """Test reset password email renders the recovery link and username."""
+    email_data = generate_reset_password_email(email_to="test@example.com", email="test@example.com", token="abc123")  # noqa: S106
 
-    # Verify token can be decoded with the actual settings
-    from app.core.config import settings
+    assert email_data.subject == f"{settings.PROJECT_NAME} - Password recovery for user test@example.com"
+    assert f"{settings.FRONTEND_HOST}/reset-password?token=abc123" in email_data.html_content
+    assert "test@example.com" in email_data.html_content
 
-    decoded = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-    assert decoded["sub"] == email
-    assert "exp" in decoded
-    assert "nbf" in decoded
+
+def test_generate_test_email() -> None:
+    """Test test email renders the recipient and project name."""
+    email_data = generate_test_email(email_to="test@example.com")
+
+    assert email_data.subject == f"{settings.PROJECT_NAME} - Test email"
+    assert "test@example.com" in email_data.html_content
+
+
+def test_generate_new_account_email() -> None:
+    """Test new account email renders the username and password."""
+    email_data = generate_new_account_email(email_to="new@example.com", username="new@example.com", password="s3cret")  # noqa: S106
+
+    assert "new@example.com" in email_data.subject
+    assert "new@example.com" in email_data.html_content
+    assert "s3cret" in email_data.html_content
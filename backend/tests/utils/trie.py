@@ -0,0 +1,20 @@
+from app.game.dictionary import Dictionary, TrieNode
+
+
+def build_trie(entries: dict[str, str | None]) -> Dictionary:
+    """Build a Dictionary from words mapped to their definitions.
+
+    Args:
+        entries: The words to insert, each mapped to its definition.
+
+    Returns:
+        A Dictionary backed by a TrieNode graph holding every entry.
+    """
+    root = TrieNode()
+    for word, definition in entries.items():
+        node = root
+        for char in word:
+            node = node.children.setdefault(char, TrieNode())
+        node.is_word = True
+        node.definition = definition
+    return Dictionary(root)